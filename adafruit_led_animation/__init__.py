@@ -5,9 +5,22 @@
 """
 Timing for Adafruit LED Animation library.
 
+Animations read the time from a clock object with a ``ticks_ms()`` method that returns
+milliseconds, wrapping around every ``2**29`` ms.  Tick values must only be compared using
+`ticks_diff()` and `ticks_less()`, and offset with `ticks_add()`, which keeps timing exact
+however long the animation runs.  Use `set_clock()` to replace the default clock, before
+creating any animations, for example with a `VirtualClock` to render animations faster than
+real time.
+
+Submodules, and the classes listed in ``_LAZY``, are imported the first time they are accessed
+as attributes of the package, so ``adafruit_led_animation.AnimationSequence`` only loads the
+modules it needs.
+
 Author(s): Kattni Rembor
 """
 
+import time
+
 try:
     from micropython import const
 except ImportError:
@@ -21,21 +34,258 @@ try:
 
     monotonic_ns()  # Test monotonic_ns in 6.x
 
+except (ImportError, NotImplementedError):
+
     def monotonic_ms():
         """
-        Return monotonic time in milliseconds.
+        Implementation of monotonic_ms for platforms without time.monotonic_ns
         """
-        return monotonic_ns() // NANOS_PER_MS
+        return int(time.monotonic() * MS_PER_SECOND)
 
-except (ImportError, NotImplementedError):
-    import time
+    def monotonic_us():
+        """
+        Implementation of monotonic_us for platforms without time.monotonic_ns
+        """
+        return int(time.monotonic() * US_PER_SECOND)
+
+else:
 
     def monotonic_ms():
         """
-        Implementation of monotonic_ms for platforms without time.monotonic_ns
+        Return monotonic time in milliseconds.
         """
-        return int(time.monotonic() * MS_PER_SECOND)
+        return monotonic_ns() // NANOS_PER_MS
+
+    def monotonic_us():
+        """
+        Return monotonic time in microseconds.
+        """
+        return monotonic_ns() // NANOS_PER_US
 
 
 NANOS_PER_MS = const(1000000)
+NANOS_PER_US = const(1000)
 MS_PER_SECOND = const(1000)
+US_PER_SECOND = const(1000000)
+
+_TICKS_PERIOD = const(1 << 29)
+_TICKS_MAX = const(_TICKS_PERIOD - 1)
+_TICKS_HALFPERIOD = const(_TICKS_PERIOD // 2)
+
+
+def ticks_add(ticks, delta):
+    """
+    Offset a tick value by a number of milliseconds, wrapping as the clock does.
+
+    :param int ticks: A value returned by ``ticks_ms()``.
+    :param int delta: Milliseconds to add, may be negative.
+    """
+    return (ticks + delta) & _TICKS_MAX
+
+
+def ticks_diff(ticks1, ticks2):
+    """
+    Compute the signed difference in milliseconds between two tick values, accounting for
+    wrap around.  The result is only valid if the values are less than ``2**28`` ms apart.
+
+    :param int ticks1: A value returned by ``ticks_ms()``.
+    :param int ticks2: A value returned by ``ticks_ms()``.
+    """
+    diff = (ticks1 - ticks2) & _TICKS_MAX
+    return ((diff + _TICKS_HALFPERIOD) & _TICKS_MAX) - _TICKS_HALFPERIOD
+
+
+def ticks_less(ticks1, ticks2):
+    """
+    Return True if ``ticks1`` is before ``ticks2``, accounting for wrap around.
+
+    :param int ticks1: A value returned by ``ticks_ms()``.
+    :param int ticks2: A value returned by ``ticks_ms()``.
+    """
+    return ticks_diff(ticks1, ticks2) < 0
+
+
+class MonotonicClock:
+    """
+    Clock based on `monotonic_ms()`, wrapped to the tick period.
+    """
+
+    @staticmethod
+    def ticks_ms():
+        """
+        Return the current time in wrapping milliseconds.
+        """
+        return monotonic_ms() & _TICKS_MAX
+
+    @staticmethod
+    def sleep(seconds):
+        """
+        Sleep for a number of seconds.
+        """
+        time.sleep(seconds)
+
+
+class SupervisorClock:
+    """
+    Clock based on ``supervisor.ticks_ms()``, which is an exact millisecond counter on
+    CircuitPython that does not lose precision as the board's uptime grows.
+    """
+
+    def __init__(self):
+        import supervisor
+
+        self.ticks_ms = supervisor.ticks_ms
+
+    @staticmethod
+    def sleep(seconds):
+        """
+        Sleep for a number of seconds.
+        """
+        time.sleep(seconds)
+
+
+class VirtualClock:
+    """
+    Clock that only moves forward when told to, so animations can be rendered or benchmarked
+    faster than real time, and reproducibly.  Sleeping on a virtual clock advances it instead
+    of waiting, so an `AnimationScheduler` runs through its frames as fast as they can be drawn.
+
+    :param float start: Starting time in seconds. Defaults to ``0``.
+
+    .. code-block:: python
+
+        import adafruit_led_animation
+        from adafruit_led_animation import VirtualClock
+
+        clock = VirtualClock()
+        adafruit_led_animation.set_clock(clock)
+
+        # Create animations after setting the clock.
+        animations = AnimationSequence(blink, comet, sparkle, advance_interval=5)
+
+        # Render ten minutes of the show.
+        while clock.elapsed < 600:
+            animations.animate()
+            clock.advance(0.01)
+    """
+
+    def __init__(self, start=0):
+        self._start_us = int(start * 1000000)
+        self._us = self._start_us
+
+    def ticks_ms(self):
+        """
+        Return the current virtual time in wrapping milliseconds.
+        """
+        return (self._us // 1000) & _TICKS_MAX
+
+    def advance(self, seconds):
+        """
+        Move the clock forward.
+
+        :param float seconds: Time to advance by, in seconds.
+        """
+        self._us += int(seconds * 1000000)
+
+    def sleep(self, seconds):
+        """
+        Advance the clock instead of sleeping.
+        """
+        self.advance(seconds)
+
+    @property
+    def elapsed(self):
+        """
+        Seconds the clock has advanced since it was created.
+        """
+        return (self._us - self._start_us) / 1000000
+
+
+try:
+    _clock = [SupervisorClock()]
+except (ImportError, AttributeError):
+    _clock = [MonotonicClock()]
+
+
+def get_clock():
+    """
+    Return the clock animations read the time from.
+    """
+    return _clock[0]
+
+
+def set_clock(clock):
+    """
+    Set the clock animations read the time from.  Animations capture the time when they are
+    created, so set the clock before creating any animations.
+
+    :param clock: An object with a ``ticks_ms()`` method returning milliseconds, wrapping
+                  around every ``2**29`` ms, and a ``sleep(seconds)`` method, for example
+                  `MonotonicClock` or `VirtualClock`.
+    """
+    _clock[0] = clock
+
+
+def ticks_ms():
+    """
+    Return the current time in wrapping milliseconds from the current clock.
+    """
+    return _clock[0].ticks_ms()
+
+
+# Submodule that provides each attribute imported on first access.
+_LAZY = {
+    "animation": "animation",
+    "color": "color",
+    "compositor": "compositor",
+    "grid": "grid",
+    "group": "group",
+    "helper": "helper",
+    "pixelbuffer": "pixelbuffer",
+    "pulse_generator": "pulse_generator",
+    "scheduler": "scheduler",
+    "sequence": "sequence",
+    "spatial": "spatial",
+    "stats": "stats",
+    "tiledgrid": "tiledgrid",
+    "timedsequence": "timedsequence",
+    "transition": "transition",
+    "AnimateOnce": "sequence",
+    "AnimationGroup": "group",
+    "AnimationScheduler": "scheduler",
+    "AnimationSequence": "sequence",
+    "Compositor": "compositor",
+    "PixelBuffer": "pixelbuffer",
+    "PixelGrid": "grid",
+    "PixelMap": "helper",
+    "PixelSubset": "helper",
+    "ShadowBuffer": "pixelbuffer",
+    "SpatialMap": "spatial",
+    "TiledGrid": "tiledgrid",
+    "TimedAnimationSequence": "timedsequence",
+}
+
+
+def _lazy_attribute(namespace, lazy, name):
+    """
+    Import the submodule that provides an attribute of a package, and cache the attribute in
+    the package.
+
+    :param dict namespace: ``globals()`` of the package.
+    :param dict lazy: Submodule name for each lazily loaded attribute.  Submodules map to
+                      their own name.
+    :param str name: Name of the attribute.
+    """
+    package = namespace["__name__"]
+    try:
+        module_name = lazy[name]
+    except KeyError:
+        raise AttributeError(f"module '{package}' has no attribute '{name}'") from None
+    module = __import__(package + "." + module_name, None, None, [module_name])
+    value = module if module_name == name else getattr(module, name)
+    namespace[name] = value
+    return value
+
+
+def __getattr__(name):
+    return _lazy_attribute(globals(), _LAZY, name)
@@ -8,6 +8,10 @@
 
 Animation base class for CircuitPython helper library for LED animations.
 
+The built-in animations are imported the first time they are accessed as attributes of this
+package, e.g. ``adafruit_led_animation.animation.Comet``, so only the animations that are used
+are loaded.
+
 * Author(s): Kattni Rembor
 
 Implementation Notes
@@ -28,7 +32,29 @@ Implementation Notes
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_LED_Animation.git"
 
-from adafruit_led_animation import MS_PER_SECOND, monotonic_ms
+from array import array
+
+from adafruit_led_animation import (
+    MS_PER_SECOND,
+    _lazy_attribute,
+    const,
+    monotonic_us,
+    ticks_add,
+    ticks_diff,
+    ticks_less,
+    ticks_ms,
+)
+
+CATCH_UP_SKIP = const(0)
+"""Drop frames that were missed, keeping later frames on the original schedule."""
+CATCH_UP_BURST = const(1)
+"""Draw and show missed frames one per ``animate()`` call until caught up."""
+CATCH_UP_LATEST = const(2)
+"""Draw all missed frames in a single ``animate()`` call, only showing the latest one."""
+
+# The FrameCommit shared by all animations, as a frame is always committed before animate()
+# returns.  Created on first use, so only animations with peers import helper.
+_frame = []
 
 
 class Animation:
@@ -36,6 +62,29 @@ class Animation:
     Base class for animations.
     """
 
+    __slots__ = (
+        "pixel_object",
+        "_peers",
+        "_speed_ms",
+        "_color",
+        "_paused",
+        "_next_update",
+        "_time_left_at_pause",
+        "_also_notify",
+        "_baked",
+        "_bake_index",
+        "_bake_max_bytes",
+        "name",
+        "cycle_complete",
+        "notify_cycles",
+        "draw_count",
+        "cycle_count",
+        "fixed_rate",
+        "catch_up",
+        "max_catch_up",
+        "stats",
+    )
+
     on_cycle_complete_supported = False
 
     def __init__(self, pixel_object, speed, color, peers=None, paused=False, name=None):
@@ -45,9 +94,12 @@ class Animation:
         self._speed_ms = 0
         self._color = None
         self._paused = paused
-        self._next_update = monotonic_ms()
+        self._next_update = ticks_ms()
         self._time_left_at_pause = 0
         self._also_notify = []
+        self._baked = None
+        self._bake_index = 0
+        self._bake_max_bytes = 0
         self.speed = speed  # sets _speed_ms
         self.color = color  # Triggers _set_color
         self.name = name
@@ -58,6 +110,19 @@ class Animation:
         """Number of animation frames drawn."""
         self.cycle_count = 0
         """Number of animation cycles completed."""
+        self.fixed_rate = False
+        """Schedule frames at fixed multiples of speed from the first frame, so frames that run
+        late do not delay the frames after them.  When ``False`` (the default) each frame is
+        scheduled speed seconds after the previous one actually ran."""
+        self.catch_up = CATCH_UP_SKIP
+        """How a ``fixed_rate`` animation handles frames it has fallen behind on:
+        ``CATCH_UP_SKIP``, ``CATCH_UP_BURST`` or ``CATCH_UP_LATEST``."""
+        self.max_catch_up = 10
+        """Maximum number of missed frames a ``fixed_rate`` animation catches up on.  Frames
+        beyond this are skipped."""
+        self.stats = None
+        """Set to a `FrameStats` to record frame timing statistics.  ``None`` (the default)
+        disables recording."""
 
     def __str__(self):
         return f"<{self.__class__.__name__}: {self.name}>"
@@ -74,29 +139,71 @@ class Animation:
         if self._paused:
             return False
 
-        now = monotonic_ms()
-        if now < self._next_update:
+        now = ticks_ms()
+        if self._time_to_next(now) > 0:
             return False
 
-        # Draw related animations together
-        for anim in self._peers:
-            anim.draw_count += 1
-            anim.draw()
-            anim.after_draw()
-
-        if show:
+        if self.stats is not None:
+            self.stats.record_frame(ticks_diff(now, self._next_update), self._speed_ms, now)
+
+        frames = 1
+        fixed_rate = self.fixed_rate and self._speed_ms
+        if fixed_rate:
+            # Number of frames missed on top of the one that is due now.
+            behind = ticks_diff(now, self._next_update) // self._speed_ms
+            if behind > self.max_catch_up:
+                self._next_update = ticks_add(
+                    self._next_update, (behind - self.max_catch_up) * self._speed_ms
+                )
+                behind = self.max_catch_up
+            if self.catch_up == CATCH_UP_SKIP:
+                self._next_update = ticks_add(self._next_update, behind * self._speed_ms)
+            elif self.catch_up == CATCH_UP_LATEST:
+                frames += behind
+
+        for frame in range(frames, 0, -1):
+            # Draw related animations together
             for anim in self._peers:
-                anim.show()
-
-        # Note that the main animation cycle_complete flag is used, not the peer flag.
-        for anim in self._peers:
-            if anim.cycle_complete:
-                anim.cycle_complete = False
-                anim.on_cycle_complete()
-
-        self._next_update = now + self._speed_ms
+                anim.draw_count += 1
+                if anim.stats is not None:
+                    start = monotonic_us()
+                if anim._baked is None:
+                    anim.draw()
+                else:
+                    anim._replay()
+                anim.after_draw()
+                if anim.stats is not None:
+                    anim.stats.record_draw(monotonic_us() - start)
+
+            if show and frame == 1:
+                if self.stats is None:
+                    self._show_peers()
+                else:
+                    start = monotonic_us()
+                    self._show_peers()
+                    self.stats.record_show(monotonic_us() - start)
+
+            # Note that the main animation cycle_complete flag is used, not the peer flag.
+            for anim in self._peers:
+                if anim.cycle_complete:
+                    anim.cycle_complete = False
+                    anim.on_cycle_complete()
+
+        if fixed_rate:
+            self._next_update = ticks_add(self._next_update, frames * self._speed_ms)
+        else:
+            self._next_update = ticks_add(now, self._speed_ms)
         return True
 
+    def _time_to_next(self, now):
+        # A deadline more than a frame away was set before the animation went unused for longer
+        # than ticks_diff() can measure, and has wrapped around, so the frame is due now.
+        wait = ticks_diff(self._next_update, now)
+        if wait > self._speed_ms:
+            self._next_update = now
+            return 0
+        return wait
+
     def draw(self):
         """
         Animation subclasses must implement draw() to render the animation sequence.
@@ -105,6 +212,135 @@ class Animation:
         """
         raise NotImplementedError()
 
+    def bake(self, max_bytes=32768):
+        """
+        Render one full cycle of the animation ahead of time, and replay the frames instead of
+        drawing each one.  Only animations that repeat exactly after a number of frames can be
+        baked, like `Chase`, `Comet`, `ColorCycle` and `Blink`.  The cycle is baked again when
+        the color, ``reverse`` or ``bounce`` changes, or the animation is reset.
+
+        :param int max_bytes: Maximum memory to use for the frames, in bytes.  If the cycle does
+                              not fit, the animation keeps drawing each frame. Defaults to 32768.
+        :return: True if the animation was baked, otherwise False.
+        """
+        from adafruit_led_animation.pixelbuffer import PixelBuffer, pixel_format
+
+        self.unbake()
+        self._bake_max_bytes = max_bytes
+        start = self._bake_state()
+        if start is None:
+            return False
+        pixel_object = self.pixel_object
+        scratch = PixelBuffer(len(pixel_object), pixel_order=pixel_format(pixel_object).order)
+        # Bake from what is on the pixels now, so the first frames replay exactly.
+        try:
+            if isinstance(pixel_object, PixelBuffer):
+                pixel_object.copy_to(scratch)
+            else:
+                scratch[:] = pixel_object[:]
+        except NotImplementedError:
+            return False
+        draw_count = self.draw_count
+        cycle_count = self.cycle_count
+        also_notify = self._also_notify
+        # Draw off-screen, without notifying anyone of the cycles drawn while baking.
+        self.pixel_object = scratch
+        self._also_notify = []
+        try:
+            baked = self._bake_cycle(scratch, max_bytes)
+        finally:
+            self.pixel_object = pixel_object
+            self._also_notify = also_notify
+            self.draw_count = draw_count
+            self.cycle_count = cycle_count
+            self.cycle_complete = False
+            self._restore_bake_state(start)
+        if baked is None:
+            return False
+        self._baked = baked
+        self._bake_index = 0
+        return True
+
+    def _bake_step(self):
+        self.draw_count += 1
+        self.draw()
+        if not self.cycle_complete:
+            return 0
+        self.cycle_complete = False
+        self.on_cycle_complete()
+        return 1
+
+    def _bake_cycle(self, scratch, max_bytes):
+        frame_size = len(scratch.buf)
+        frames = []
+        frame_indices = {}
+        order = array("H")
+        flags = bytearray()
+        states = []
+        seen = {}
+        size = 0
+        loop = None
+        end = None
+        # Record until the state repeats, then one more cycle.  Replay loops over that second
+        # cycle, whose frames no longer depend on what was on the pixels before baking.
+        while end is None or len(order) < end:
+            state = self._bake_state()
+            if loop is None:
+                if state in seen:
+                    loop = len(order)
+                    end = loop + loop - seen[state]
+                else:
+                    seen[state] = len(order)
+            size += 4
+            if size > max_bytes:
+                return None
+            states.append(state)
+            flags.append(self._bake_step())
+            frame = bytes(scratch.buf)
+            frame_index = frame_indices.get(frame)
+            if frame_index is None:
+                size += frame_size
+                if size > max_bytes:
+                    return None
+                frame_index = len(frames)
+                frames.append(frame)
+                frame_indices[frame] = frame_index
+            order.append(frame_index)
+        return frames, order, flags, states, loop, scratch
+
+    def _replay(self):
+        frames, order, flags, states, loop, scratch = self._baked
+        index = self._bake_index
+        scratch._buf[:] = frames[order[index]]
+        scratch.copy_to(self.pixel_object)
+        if flags[index]:
+            self.cycle_complete = True
+        index += 1
+        if index == len(order):
+            index = loop
+        self._bake_index = index
+        # Keep the state in step, so it is current if the animation is reset or changed.
+        self._restore_bake_state(states[index])
+
+    def unbake(self):
+        """
+        Stop replaying baked frames, and draw each frame again.
+        """
+        self._baked = None
+
+    def _bake_state(self):
+        """
+        Animations that can be baked return a value that determines the next frame they draw,
+        and changes with every frame until a cycle is complete.  ``None`` if the animation
+        cannot be baked.
+        """
+        return None
+
+    def _restore_bake_state(self, state):
+        """
+        Return the animation to a state returned by ``_bake_state()``.
+        """
+
     def after_draw(self):
         """
         Animation subclasses may implement after_draw() to do operations after the main draw()
@@ -113,9 +349,48 @@ class Animation:
 
     def show(self):
         """
-        Displays the updated pixels.  Called during animates with changes.
+        Displays the updated pixels.  Called during animates with changes.  Skipped if the
+        pixel object tracks changes, like `PixelBuffer`, and no pixel has changed.
         """
-        self.pixel_object.show()
+        if getattr(self.pixel_object, "dirty", True):
+            self.pixel_object.show()
+
+    def _show_peers(self):
+        if len(self._peers) == 1:
+            self.show()
+            return
+        # Peers often share a strip, so show each strip only once.  The show is timed by
+        # animate(), so the animation is not passed to the frame.
+        if not _frame:
+            from adafruit_led_animation.helper import FrameCommit
+
+            _frame.append(FrameCommit())
+        frame = _frame[0]
+        for anim in self._peers:
+            frame.add(anim.pixel_object)
+        frame.show()
+
+    def collect_strips(self, frame):
+        """
+        Adds the pixel objects of the animation and its peers to a `FrameCommit`, so that
+        groups and schedulers can show each strip once per frame, and record the time taken
+        in the animation's `FrameStats`.
+
+        :param FrameCommit frame: The frame to add the pixel objects to.
+        """
+        for anim in self._peers:
+            frame.add(anim.pixel_object, self)
+
+    @property
+    def next_update(self):
+        """
+        The time the next frame is due, in ticks as returned by ``ticks_ms()``, or ``None`` if
+        the animation is paused.
+        """
+        if self._paused:
+            return None
+        self._time_to_next(ticks_ms())
+        return self._next_update
 
     @property
     def peers(self):
@@ -138,13 +413,13 @@ class Animation:
         Stops the animation until resumed.
         """
         self._paused = True
-        self._time_left_at_pause = max(0, monotonic_ms() - self._next_update)
+        self._time_left_at_pause = max(0, self._time_to_next(ticks_ms()))
 
     def resume(self):
         """
         Resumes the animation.
         """
-        self._next_update = monotonic_ms() + self._time_left_at_pause
+        self._next_update = ticks_add(ticks_ms(), self._time_left_at_pause)
         self._time_left_at_pause = 0
         self._paused = False
 
@@ -169,6 +444,8 @@ class Animation:
         if isinstance(color, int):
             color = (color >> 16 & 0xFF, color >> 8 & 0xFF, color & 0xFF)
         self._set_color(color)
+        if self._baked is not None:
+            self.bake(self._bake_max_bytes)
 
     def _set_color(self, color):
         """
@@ -210,5 +487,54 @@ class Animation:
 
     def reset(self):
         """
-        Resets the animation sequence.
+        Resets the animation sequence.  Subclasses that can be baked call this after resetting
+        their state.
         """
+        if getattr(self, "_baked", None) is not None:
+            self._baked = None
+            self.bake(self._bake_max_bytes)
+
+
+# Submodule that provides each attribute imported on first access.
+_LAZY = {
+    "blink": "blink",
+    "chase": "chase",
+    "colorcycle": "colorcycle",
+    "comet": "comet",
+    "customcolorchase": "customcolorchase",
+    "grid_rain": "grid_rain",
+    "multicolor_comet": "multicolor_comet",
+    "pacman": "pacman",
+    "pulse": "pulse",
+    "rainbow": "rainbow",
+    "rainbowchase": "rainbowchase",
+    "rainbowcomet": "rainbowcomet",
+    "rainbowsparkle": "rainbowsparkle",
+    "solid": "solid",
+    "sparkle": "sparkle",
+    "sparklepulse": "sparklepulse",
+    "volume": "volume",
+    "Blink": "blink",
+    "Chase": "chase",
+    "ColorCycle": "colorcycle",
+    "Comet": "comet",
+    "CustomColorChase": "customcolorchase",
+    "MatrixRain": "grid_rain",
+    "MulticolorComet": "multicolor_comet",
+    "Pacman": "pacman",
+    "Pulse": "pulse",
+    "Rain": "grid_rain",
+    "Rainbow": "rainbow",
+    "RainbowChase": "rainbowchase",
+    "RainbowComet": "rainbowcomet",
+    "RainbowRain": "grid_rain",
+    "RainbowSparkle": "rainbowsparkle",
+    "Solid": "solid",
+    "Sparkle": "sparkle",
+    "SparklePulse": "sparklepulse",
+    "Volume": "volume",
+}
+
+
+def __getattr__(name):
+    return _lazy_attribute(globals(), _LAZY, name)
@@ -42,6 +42,8 @@ class Blink(ColorCycle):
     :param name: A human-readable name for the Animation. Used by the string function.
     """
 
+    __slots__ = ("_background_color",)
+
     def __init__(self, pixel_object, speed, color, background_color=BLACK, name=None):
         self._background_color = background_color
         super().__init__(pixel_object, speed, [color, background_color], name=name)
@@ -43,6 +43,18 @@ class Chase(Animation):
     :param reverse: Reverse direction of movement.
     """
 
+    __slots__ = (
+        "_size",
+        "_spacing",
+        "_repeat_width",
+        "_num_repeats",
+        "_overflow",
+        "_direction",
+        "_reverse",
+        "_offset",
+        "_reset",
+    )
+
     def __init__(self, pixel_object, speed, color, size=2, spacing=3, reverse=False, name=None):
         self._size = size
         self._spacing = spacing
@@ -73,8 +85,13 @@ class Chase(Animation):
 
     @reverse.setter
     def reverse(self, value):
+        self._set_reverse(value)
+        if self._baked is not None:
+            self.bake(self._bake_max_bytes)
+
+    def _set_reverse(self, value):
         self._reverse = value
-        self._direction = -1 if self._reverse else 1
+        self._direction = -1 if value else 1
 
     def draw(self):
         def bar_colors():
@@ -118,8 +135,16 @@ class Chase(Animation):
         """
         return 0
 
+    def _bake_state(self):
+        return self._offset, self._reverse, self.draw_count % len(self.pixel_object)
+
+    def _restore_bake_state(self, state):
+        self._offset, reverse, _ = state
+        self._set_reverse(reverse)
+
     def reset(self):
         """
         Reset the animation.
         """
         self._reset()
+        super().reset()
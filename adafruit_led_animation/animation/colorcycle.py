@@ -41,30 +41,36 @@ class ColorCycle(Animation):
     :param start_color: An index (from 0) for which color to start from. Default 0 (first color).
     """
 
+    __slots__ = ("colors", "start_color", "_color_index")
+
     def __init__(self, pixel_object, speed, colors=RAINBOW, name=None, start_color=0):
         self.colors = colors
         self.start_color = start_color
+        self._color_index = start_color
         super().__init__(pixel_object, speed, colors[start_color], name=name)
-        self._generator = self._color_generator(start_color)
-        next(self._generator)
+        self._color = self.colors[start_color]
 
     on_cycle_complete_supported = True
 
     def draw(self):
         self.pixel_object.fill(self.color)
-        next(self._generator)
-
-    def _color_generator(self, start_color):
-        index = start_color
-        while True:
-            self._color = self.colors[index]
-            yield
-            index = (index + 1) % len(self.colors)
-            if index == start_color:
-                self.cycle_complete = True
+        index = (self._color_index + 1) % len(self.colors)
+        if index == self.start_color:
+            self.cycle_complete = True
+        self._color_index = index
+        self._color = self.colors[index]
 
     def reset(self):
         """
         Resets to the first color.
         """
-        self._generator = self._color_generator(self.start_color)
+        self._color_index = self.start_color
+        self._color = self.colors[self.start_color]
+        super().reset()
+
+    def _bake_state(self):
+        return self._color_index
+
+    def _restore_bake_state(self, state):
+        self._color_index = state
+        self._color = self.colors[state]
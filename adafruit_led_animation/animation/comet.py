@@ -49,6 +49,23 @@ class Comet(Animation):
     :param bool ring: Ring mode.  Defaults to ``False``.
     """
 
+    __slots__ = (
+        "_bounce",
+        "_reverse",
+        "_initial_reverse",
+        "_tail_length",
+        "_color_step",
+        "_comet_colors",
+        "_computed_color",
+        "_background_color",
+        "_num_pixels",
+        "_direction",
+        "_left_side",
+        "_right_side",
+        "_tail_start",
+        "_ring",
+    )
+
     def __init__(
         self,
         pixel_object,
@@ -65,7 +82,7 @@ class Comet(Animation):
             tail_length = len(pixel_object) // 4
         if bounce and ring:
             raise ValueError("Cannot combine bounce and ring mode")
-        self.bounce = bounce
+        self._bounce = bounce
         self._reverse = reverse
         self._initial_reverse = reverse
         self._tail_length = tail_length
@@ -101,8 +118,26 @@ class Comet(Animation):
 
     @reverse.setter
     def reverse(self, value):
+        self._set_reverse(value)
+        if self._baked is not None:
+            self.bake(self._bake_max_bytes)
+
+    def _set_reverse(self, value):
         self._reverse = value
-        self._direction = -1 if self._reverse else 1
+        self._direction = -1 if value else 1
+
+    @property
+    def bounce(self):
+        """
+        Whether the comet bounces back and forth.
+        """
+        return self._bounce
+
+    @bounce.setter
+    def bounce(self, value):
+        self._bounce = value
+        if self._baked is not None:
+            self.bake(self._bake_max_bytes)
 
     @property
     def ring(self):
@@ -122,25 +157,31 @@ class Comet(Animation):
     def draw(self):
         colors = self._comet_colors
         if self.reverse:
-            colors = reversed(colors)
+            colors = colors[::-1]
 
+        # Write the tail as slices, so the pixel object converts it in one call.
         pixels = self.pixel_object
         start = self._tail_start
         npixels = len(pixels)
+        length = len(colors)
         if self._ring:
             start %= npixels
-            for color in colors:
-                pixels[start] = color
-                start += 1
-                if start == npixels:
-                    start = 0
-        else:
-            for color in colors:
-                if start >= npixels:
-                    break
-                if start >= 0:
+            if length > npixels:
+                for color in colors:
                     pixels[start] = color
-                start += 1
+                    start += 1
+                    if start == npixels:
+                        start = 0
+            else:
+                first = min(length, npixels - start)
+                pixels[start : start + first] = colors[:first]
+                if first < length:
+                    pixels[0 : length - first] = colors[first:]
+        else:
+            low = max(start, 0)
+            high = min(start + length, npixels)
+            if low < high:
+                pixels[low:high] = colors[low - start : high - start]
 
         self._tail_start += self._direction
 
@@ -148,7 +189,7 @@ class Comet(Animation):
             self._tail_start >= self._right_side and not self._reverse
         ):
             if self.bounce:
-                self.reverse = not self.reverse
+                self._set_reverse(not self._reverse)
             elif self._ring:
                 self._tail_start = self._tail_start % self._num_pixels
             else:
@@ -167,3 +208,11 @@ class Comet(Animation):
 
         if self._ring:
             self._tail_start = self._tail_start % self._num_pixels
+        super().reset()
+
+    def _bake_state(self):
+        return self._tail_start, self._reverse
+
+    def _restore_bake_state(self, state):
+        self._tail_start, reverse = state
+        self._set_reverse(reverse)
@@ -43,6 +43,8 @@ class CustomColorChase(Chase):
     :param reverse: Reverse direction of movement.
     """
 
+    __slots__ = ("_num_colors", "_colors", "_color_idx")
+
     def __init__(
         self,
         pixel_object,
@@ -64,3 +66,10 @@ class CustomColorChase(Chase):
     def on_cycle_complete(self):
         self._color_idx = (self._color_idx + self._direction) % len(self._colors)
         super().on_cycle_complete()
+
+    def _bake_state(self):
+        return super()._bake_state() + (self._color_idx,)
+
+    def _restore_bake_state(self, state):
+        super()._restore_bake_state(state[:-1])
+        self._color_idx = state[-1]
@@ -47,6 +47,8 @@ class Rain(Animation):
     :param background: Background color (Default BLACK).
     """
 
+    __slots__ = ("_count", "_length", "_background", "_raindrops")
+
     def __init__(self, grid_object, speed, color, count=1, length=3, background=BLACK, name=None):
         self._count = count
         self._length = length
@@ -89,6 +91,8 @@ class RainbowRain(Rain):
     Rainbow Rain animation.
     """
 
+    __slots__ = ()
+
     def __init__(self, grid_object, speed, count=1, length=3, background=BLACK, name=None):
         super().__init__(grid_object, speed, BLACK, count, length, background, name)
 
@@ -105,6 +109,8 @@ class MatrixRain(Rain):
     The Matrix style animation.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         grid_object,
@@ -51,6 +51,8 @@ class MulticolorComet(Comet):
                             to remain on and set to a color after the comet passes.
     """
 
+    __slots__ = ("_colors", "_off_pixels")
+
     def __init__(
         self,
         pixel_object,
@@ -68,7 +70,7 @@ class MulticolorComet(Comet):
             tail_length = len(pixel_object) // 4
         if bounce and ring:
             raise ValueError("Cannot combine bounce and ring mode")
-        self.bounce = bounce
+        self._bounce = bounce
         self._reverse = reverse
         self._initial_reverse = reverse
         self._tail_length = tail_length
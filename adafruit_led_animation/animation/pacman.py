@@ -23,8 +23,7 @@ Implementation Notes
 
 """
 
-import time
-
+from adafruit_led_animation import MS_PER_SECOND, ticks_diff, ticks_ms
 from adafruit_led_animation.animation import Animation
 from adafruit_led_animation.color import (
     BLACK,
@@ -48,6 +47,19 @@ class Pacman(Animation):
     :param float speed: Animation speed rate in seconds, e.g. ``0.1``.
     """
 
+    __slots__ = (
+        "num_leds",
+        "pacman",
+        "ghosts_original",
+        "ghosts",
+        "direction",
+        "black_dir",
+        "flag",
+        "power_pellet",
+        "ghost_timer",
+        "start_blinking_ghosts",
+    )
+
     def __init__(
         self,
         pixel_object,
@@ -63,7 +75,7 @@ class Pacman(Animation):
         self.black_dir = -1
         self.flag = "beep"
         self.power_pellet = [ORANGEYELLOW, self.num_leds]
-        self.ghost_timer = time.monotonic()
+        self.ghost_timer = ticks_ms()
         if self.num_leds > 150:
             self.start_blinking_ghosts = self.num_leds // 4
         else:
@@ -84,15 +96,15 @@ class Pacman(Animation):
         pixel_list = self.pixel_object
         pixel_list[-1] = self.power_pellet[0]
 
-        delta = time.monotonic() - self.ghost_timer
-        if delta > 1:
+        delta = ticks_diff(ticks_ms(), self.ghost_timer)
+        if delta > MS_PER_SECOND or delta < 0:
             if self.power_pellet[0] == ORANGEYELLOW:
                 self.power_pellet[0] = BLACK
             else:
                 self.power_pellet[0] = ORANGEYELLOW
             pixel_list[self.power_pellet[1] - 1] = self.power_pellet[0]
 
-            self.ghost_timer = time.monotonic()
+            self.ghost_timer = ticks_ms()
 
         if self.pacman[1] >= self.num_leds - 2:
             self.direction = self.direction * -1
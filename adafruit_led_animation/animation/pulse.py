@@ -42,6 +42,8 @@ class Pulse(Animation):
     :param max_intensity: Highest brightness level of the pulse. Default 1.
     """
 
+    __slots__ = ("_period", "breath", "min_intensity", "max_intensity", "_generator")
+
     def __init__(
         self,
         pixel_object,
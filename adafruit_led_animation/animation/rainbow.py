@@ -25,7 +25,7 @@ Implementation Notes
 
 """
 
-from adafruit_led_animation import MS_PER_SECOND, monotonic_ms
+from adafruit_led_animation import MS_PER_SECOND, ticks_diff, ticks_ms
 from adafruit_led_animation.animation import Animation
 from adafruit_led_animation.color import BLACK, colorwheel
 
@@ -46,6 +46,8 @@ class Rainbow(Animation):
                                     (default True).
     """
 
+    __slots__ = ("_period", "_step", "_wheel_index", "colors", "_generator")
+
     def __init__(self, pixel_object, speed, period=5, step=1, name=None, precompute_rainbow=True):
         super().__init__(pixel_object, speed, BLACK, name=name)
         self._period = period
@@ -70,13 +72,13 @@ class Rainbow(Animation):
         period = int(self._period * MS_PER_SECOND)
 
         num_pixels = len(self.pixel_object)
-        last_update = monotonic_ms()
+        last_update = ticks_ms()
         cycle_position = 0
         last_pos = 0
         while True:
             cycle_completed = False
-            now = monotonic_ms()
-            time_since_last_draw = now - last_update
+            now = ticks_ms()
+            time_since_last_draw = ticks_diff(now, last_update)
             last_update = now
             pos = cycle_position = (cycle_position + time_since_last_draw) % period
             if pos < last_pos:
@@ -46,6 +46,8 @@ class RainbowComet(Comet):
     :param bool ring: Ring mode.  Defaults to ``False``.
     """
 
+    __slots__ = ("_colorwheel_offset", "_colorwheel_step")
+
     def __init__(
         self,
         pixel_object,
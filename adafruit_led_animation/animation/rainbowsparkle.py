@@ -46,6 +46,8 @@ class RainbowSparkle(Rainbow):
                                     (default True).
     """
 
+    __slots__ = ("_num_sparkles", "_sparkle_duration", "_background_brightness", "_bright_colors")
+
     def __init__(
         self,
         pixel_object,
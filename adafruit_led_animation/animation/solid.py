@@ -37,6 +37,8 @@ class Solid(ColorCycle):
     :param color: Animation color in ``(r, g, b)`` tuple, or ``0x000000`` hex format.
     """
 
+    __slots__ = ()
+
     def __init__(self, pixel_object, color, name=None):
         super().__init__(pixel_object, speed=1, colors=[color], name=name)
 
@@ -44,6 +44,16 @@ class Sparkle(Animation):
     :param mask: array to limit sparkles within range of the mask
     """
 
+    __slots__ = (
+        "_half_color",
+        "_dim_color",
+        "_sparkle_color",
+        "_num_sparkles",
+        "_num_pixels",
+        "_pixels",
+        "_mask",
+    )
+
     def __init__(self, pixel_object, speed, color, num_sparkles=1, name=None, mask=None):
         if len(pixel_object) < 2:
             raise ValueError("Sparkle needs at least 2 pixels")
@@ -64,11 +74,18 @@ class Sparkle(Animation):
     def _set_color(self, color):
         half_color = tuple(color[rgb] // 4 for rgb in range(len(color)))
         dim_color = tuple(color[rgb] // 10 for rgb in range(len(color)))
-        for pixel in range(len(self.pixel_object)):
-            if self.pixel_object[pixel] == self._half_color:
-                self.pixel_object[pixel] = half_color
-            elif self.pixel_object[pixel] == self._dim_color:
-                self.pixel_object[pixel] = dim_color
+        # Read the frame once, and write it back in one slice if any pixel changed.
+        frame = self.pixel_object[:]
+        changed = False
+        for pixel, value in enumerate(frame):
+            if value == self._half_color:
+                frame[pixel] = half_color
+                changed = True
+            elif value == self._dim_color:
+                frame[pixel] = dim_color
+                changed = True
+        if changed:
+            self.pixel_object[:] = frame
         self._half_color = half_color
         self._dim_color = dim_color
         self._sparkle_color = color
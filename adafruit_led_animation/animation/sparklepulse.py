@@ -43,6 +43,8 @@ class SparklePulse(Sparkle):
     :param min_intensity: The minimum intensity to pulse, between 0 and 1.0.  Default 0.
     """
 
+    __slots__ = ("_period", "breath", "min_intensity", "max_intensity", "_generator")
+
     def __init__(
         self,
         pixel_object,
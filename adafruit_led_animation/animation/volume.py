@@ -42,6 +42,8 @@ class Volume(Animation):
     :param float max_volume: what volume is considered maximum where everything is lit up
     """
 
+    __slots__ = ("_decoder", "_num_pixels", "_max_volume", "_brightest_color")
+
     def __init__(
         self,
         pixel_object,
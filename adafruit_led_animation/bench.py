@@ -0,0 +1,481 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_led_animation.bench`
+================================================================================
+
+Benchmark suite for CircuitPython helper library for LED animations.
+
+Times ``draw()`` and ``show()`` of every built-in animation on in-memory `PixelBuffer` strips of
+several lengths, directly and through `PixelMap` and `PixelGrid`, using a `VirtualClock` so
+results do not depend on wall-clock timing.  The heap used by each animation instance, and
+allocated per frame, is measured with ``tracemalloc``.  Run it on a desktop computer or
+Raspberry Pi:
+
+.. code-block:: shell
+
+    python -m adafruit_led_animation.bench --sizes 30 300 3000 --json before.json
+    python -m adafruit_led_animation.bench --sizes 30 300 3000 --compare before.json
+
+With ``--imports``, it instead measures the time to import each public module in a fresh
+interpreter with ``python -X importtime``, and with ``--import-budget`` exits with an error if
+any module takes longer than the budget:
+
+.. code-block:: shell
+
+    python -m adafruit_led_animation.bench --import-budget 20
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* CPython 3 and Adafruit Blinka
+
+"""
+
+import argparse
+import json
+import math
+import os
+import pkgutil
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import adafruit_led_animation
+from adafruit_led_animation import VirtualClock
+from adafruit_led_animation.color import AMBER, JADE, PURPLE, RAINBOW, WHITE
+from adafruit_led_animation.grid import PixelGrid
+from adafruit_led_animation.helper import PixelSubset
+from adafruit_led_animation.pixelbuffer import PixelBuffer
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_LED_Animation.git"
+
+DEFAULT_SIZES = (30, 300, 3000, 30000, 100000)
+SPEED = 0.01
+IMPORT_REPEAT = 5
+
+
+class _Decoder:
+    """Stands in for an MP3Decoder, sweeping rms_level up and down."""
+
+    def __init__(self):
+        self._frame = 0
+
+    @property
+    def rms_level(self):
+        self._frame += 1
+        return abs(self._frame % 1000 - 500)
+
+
+def _comet(pixels):
+    from adafruit_led_animation.animation.comet import Comet
+
+    return Comet(pixels, SPEED, PURPLE, tail_length=max(2, len(pixels) // 10), bounce=True)
+
+
+def _chase(pixels):
+    from adafruit_led_animation.animation.chase import Chase
+
+    return Chase(pixels, SPEED, WHITE, size=3, spacing=6)
+
+
+def _rainbow(pixels):
+    from adafruit_led_animation.animation.rainbow import Rainbow
+
+    return Rainbow(pixels, SPEED, period=2)
+
+
+def _rainbow_sparkle(pixels):
+    from adafruit_led_animation.animation.rainbowsparkle import RainbowSparkle
+
+    return RainbowSparkle(pixels, SPEED, period=2)
+
+
+def _sparkle(pixels):
+    from adafruit_led_animation.animation.sparkle import Sparkle
+
+    return Sparkle(pixels, SPEED, AMBER, num_sparkles=max(1, len(pixels) // 20))
+
+
+def _pulse(pixels):
+    from adafruit_led_animation.animation.pulse import Pulse
+
+    return Pulse(pixels, SPEED, AMBER, period=2)
+
+
+def _multicolor_comet(pixels):
+    from adafruit_led_animation.animation.multicolor_comet import MulticolorComet
+
+    return MulticolorComet(pixels, SPEED, RAINBOW, tail_length=max(6, len(pixels) // 10))
+
+
+def _rain(pixels):
+    from adafruit_led_animation.animation.grid_rain import Rain
+
+    return Rain(pixels, SPEED, JADE, count=max(1, pixels.width // 2))
+
+
+def _matrix_rain(pixels):
+    from adafruit_led_animation.animation.grid_rain import MatrixRain
+
+    return MatrixRain(pixels, SPEED, count=max(1, pixels.width // 2))
+
+
+def _pacman(pixels):
+    from adafruit_led_animation.animation.pacman import Pacman
+
+    return Pacman(pixels, SPEED)
+
+
+def _volume(pixels):
+    from adafruit_led_animation.animation.volume import Volume
+
+    return Volume(pixels, SPEED, WHITE, _Decoder())
+
+
+def _strip(n):
+    return PixelBuffer(n)
+
+
+def _pixel_map(n):
+    return PixelSubset(PixelBuffer(n), 0, n)
+
+
+def _pixel_grid(n):
+    width = max(1, int(math.sqrt(n)))
+    return PixelGrid(PixelBuffer(n), width, n // width)
+
+
+TARGETS = {
+    "strip": _strip,
+    "map": _pixel_map,
+    "grid": _pixel_grid,
+}
+"""Pixel objects to benchmark on, by name."""
+
+BENCHMARKS = (
+    ("Comet", _comet, ("strip", "map")),
+    ("Chase", _chase, ("strip", "map")),
+    ("Rainbow", _rainbow, ("strip", "map")),
+    ("RainbowSparkle", _rainbow_sparkle, ("strip",)),
+    ("Sparkle", _sparkle, ("strip", "map")),
+    ("Pulse", _pulse, ("strip", "map")),
+    ("MulticolorComet", _multicolor_comet, ("strip",)),
+    ("Rain", _rain, ("grid",)),
+    ("MatrixRain", _matrix_rain, ("grid",)),
+    ("Pacman", _pacman, ("strip",)),
+    ("Volume", _volume, ("strip",)),
+)
+"""Animations to benchmark: name, factory taking a pixel object, and target names."""
+
+
+def _allocations(animation, clock, frames):
+    """Average peak bytes allocated while drawing a frame."""
+    total = 0
+    tracemalloc.start()
+    try:
+        for _ in range(frames):
+            clock.advance(SPEED)
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            animation.animate(show=False)
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return total / frames
+
+
+def _instance_bytes(factory, pixels):
+    """Bytes allocated to create an animation, including any buffers it creates."""
+    tracemalloc.start()
+    try:
+        animation = factory(pixels)
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del animation
+    return size
+
+
+def run_benchmark(name, factory, target, size, max_frames=100, max_time=1.0, bake=False):
+    """
+    Benchmark one animation on one pixel object.
+
+    :param str name: Name of the animation, used in the result.
+    :param factory: Function that creates the animation from a pixel object.
+    :param str target: Name of the pixel object in `TARGETS`.
+    :param int size: Number of pixels.
+    :param int max_frames: Maximum number of frames to time.
+    :param float max_time: Stop timing once this many seconds have been spent drawing.
+    :param bool bake: Bake the animation before timing it, if it can be baked.
+    :return: dict of results.
+    """
+    clock = VirtualClock()
+    adafruit_led_animation.set_clock(clock)
+    pixels = TARGETS[target](size)
+    animation = factory(pixels)
+    baked = animation.bake() if bake else False
+
+    draw_time = show_time = 0.0
+    frames = 0
+    while frames < max_frames and (frames < 3 or draw_time + show_time < max_time):
+        clock.advance(SPEED)
+        start = time.perf_counter()
+        animation.animate(show=False)
+        drawn = time.perf_counter()
+        animation.show()
+        show_time += time.perf_counter() - drawn
+        draw_time += drawn - start
+        frames += 1
+
+    alloc = _allocations(animation, clock, min(frames, 10))
+    # Measured on a second instance, so that importing the animation is not counted.
+    instance = _instance_bytes(factory, TARGETS[target](size))
+    return {
+        "animation": name,
+        "target": target,
+        "pixels": size,
+        "frames": frames,
+        "draw_us": draw_time / frames * 1000000,
+        "show_us": show_time / frames * 1000000,
+        "fps": frames / (draw_time + show_time),
+        "us_per_pixel": draw_time / frames / size * 1000000,
+        "alloc_bytes_per_frame": alloc,
+        "instance_bytes": instance,
+        "baked": baked,
+    }
+
+
+def run(
+    sizes=DEFAULT_SIZES,
+    animations=None,
+    max_frames=100,
+    max_time=1.0,
+    out=sys.stdout,
+    bake=False,
+):
+    """
+    Run the benchmark suite, printing a line per result.
+
+    :param sizes: Strip lengths to benchmark.
+    :param animations: Names of the animations to benchmark, or ``None`` for all.
+    :param int max_frames: Maximum number of frames to time per benchmark.
+    :param float max_time: Maximum time in seconds to spend drawing per benchmark.
+    :param out: File to print results to, or ``None`` to not print them.
+    :param bool bake: Bake the animations that can be baked before timing them.
+    :return: list of result dicts.
+    """
+    results = []
+    if out:
+        print(_header(), file=out)
+    default_clock = adafruit_led_animation.get_clock()
+    try:
+        for name, factory, targets in BENCHMARKS:
+            if animations and name not in animations:
+                continue
+            for target in targets:
+                for size in sizes:
+                    result = run_benchmark(name, factory, target, size, max_frames, max_time, bake)
+                    results.append(result)
+                    if out:
+                        print(_format(result), file=out)
+    finally:
+        adafruit_led_animation.set_clock(default_clock)
+    return results
+
+
+def _header():
+    return (
+        f"{'animation':<16} {'target':<6} {'pixels':>7} {'draw us':>11} {'show us':>9} "
+        f"{'fps':>10} {'us/pixel':>9} {'alloc B':>9} {'inst B':>9}"
+    )
+
+
+def _format(result, baseline=None):
+    line = (
+        f"{result['animation']:<16} {result['target']:<6} {result['pixels']:>7} "
+        f"{result['draw_us']:>11.1f} {result['show_us']:>9.1f} {result['fps']:>10.1f} "
+        f"{result['us_per_pixel']:>9.3f} {result['alloc_bytes_per_frame']:>9.0f} "
+        f"{result['instance_bytes']:>9}"
+    )
+    if baseline:
+        line += f"  {result['fps'] / baseline['fps']:>6.2f}x fps"
+    return line
+
+
+def _key(result):
+    return (result["animation"], result["target"], result["pixels"])
+
+
+def compare(results, baseline_results, out=sys.stdout):
+    """
+    Print results alongside their speed up over matching baseline results.
+
+    :param results: list of result dicts from `run`.
+    :param baseline_results: list of result dicts from an earlier run, e.g. loaded from JSON.
+    :param out: File to print the comparison to.
+    """
+    baseline = {_key(result): result for result in baseline_results}
+    print(_header() + "  vs baseline", file=out)
+    for result in results:
+        print(_format(result, baseline.get(_key(result))), file=out)
+
+
+def public_modules():
+    """
+    Names of the public modules of the library, not including the benchmark suite.
+    """
+    names = ["adafruit_led_animation"]
+    for module in pkgutil.walk_packages(adafruit_led_animation.__path__, "adafruit_led_animation."):
+        if module.name != "adafruit_led_animation.bench" and "._" not in module.name:
+            names.append(module.name)
+    return names
+
+
+def _imported(statement):
+    """Microseconds spent importing each module while running a statement in a new interpreter."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if process.returncode:
+        raise RuntimeError(process.stderr)
+    times = {}
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith("import time:") and line.count("|") == 2:
+            self_us, _, name = line[len("import time:") :].split("|")
+            if self_us.strip().isdigit():
+                times[name.strip()] = int(self_us)
+    return times
+
+
+def import_time(module, repeat=IMPORT_REPEAT):
+    """
+    Time to import a module and everything it imports, in a new interpreter, as reported by
+    ``python -X importtime``.  Modules imported when the interpreter starts are not counted.
+
+    :param str module: Name of the module to import.
+    :param int repeat: Number of times to import the module, returning the fastest.
+    :return: Import time in microseconds.
+    """
+    startup = _imported("pass")
+    best = None
+    for _ in range(repeat):
+        times = _imported("import " + module)
+        total = sum(us for name, us in times.items() if name not in startup)
+        best = total if best is None else min(best, total)
+    return best
+
+
+def run_imports(modules=None, budget_ms=None, repeat=IMPORT_REPEAT, out=sys.stdout):
+    """
+    Measure the import time of each module, printing a line per module.
+
+    :param modules: Names of the modules to import, or ``None`` for all public modules.
+    :param float budget_ms: Import time budget for each module in milliseconds, or ``None``.
+    :param int repeat: Number of times to import each module, keeping the fastest.
+    :param out: File to print results to, or ``None`` to not print them.
+    :return: list of result dicts.
+    """
+    results = []
+    for module in modules or public_modules():
+        import_us = import_time(module, repeat)
+        over = budget_ms is not None and import_us > budget_ms * 1000
+        results.append({"module": module, "import_us": import_us, "over_budget": over})
+        if out:
+            print(
+                f"{module:<52} {import_us / 1000:>8.2f} ms{'  over budget' if over else ''}",
+                file=out,
+            )
+    return results
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m adafruit_led_animation.bench",
+        description="Benchmark the built-in LED animations.",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--animations", nargs="+", help="Animation names to benchmark")
+    parser.add_argument("--frames", type=int, default=100, help="Maximum frames per benchmark")
+    parser.add_argument("--max-time", type=float, default=1.0, help="Maximum seconds per benchmark")
+    parser.add_argument("--json", help="Save results to this JSON file")
+    parser.add_argument("--compare", help="Compare against results saved with --json")
+    parser.add_argument("--bake", action="store_true", help="Bake animations that can be baked")
+    parser.add_argument("--imports", action="store_true", help="Measure module import times")
+    parser.add_argument(
+        "--import-budget",
+        type=float,
+        help="Measure module import times, failing if any takes longer than this many ms",
+    )
+    args = parser.parse_args(argv)
+
+    if args.imports or args.import_budget is not None:
+        imports = run_imports(budget_ms=args.import_budget)
+        if args.json:
+            with open(args.json, "w") as results_file:
+                json.dump(
+                    {
+                        "python": sys.version,
+                        "platform": platform.platform(),
+                        "imports": imports,
+                    },
+                    results_file,
+                    indent=2,
+                )
+        if any(result["over_budget"] for result in imports):
+            sys.exit(1)
+        return
+
+    baseline_results = None
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline_results = json.load(baseline_file).get("results")
+        if baseline_results is None:
+            parser.error(
+                f"{args.compare} has no animation results to compare against. "
+                "Save them with --json, without --imports."
+            )
+
+    results = run(
+        args.sizes,
+        args.animations,
+        args.frames,
+        args.max_time,
+        out=None if args.compare else sys.stdout,
+        bake=args.bake,
+    )
+    if baseline_results is not None:
+        compare(results, baseline_results)
+    if args.json:
+        with open(args.json, "w") as results_file:
+            json.dump(
+                {
+                    "python": sys.version,
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                results_file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
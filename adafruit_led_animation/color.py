@@ -24,9 +24,6 @@ Implementation Notes
   https://circuitpython.org/downloads
 """
 
-# Makes colorwheel() available.
-from rainbowio import colorwheel
-
 RED = (255, 0, 0)
 """Red."""
 YELLOW = (255, 150, 0)
@@ -110,3 +107,13 @@ def calculate_intensity(color, intensity=1.0):
         int(color[2] * intensity),
         int(color[3] * intensity),
     )
+
+
+def __getattr__(name):
+    # Makes colorwheel() available, importing rainbowio only when it is first used.
+    if name == "colorwheel":
+        from rainbowio import colorwheel
+
+        globals()["colorwheel"] = colorwheel
+        return colorwheel
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -0,0 +1,259 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_led_animation.compositor`
+================================================================================
+
+Layer compositor for CircuitPython helper library for LED animations.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit NeoPixels <https://www.adafruit.com/category/168>`_
+* `Adafruit DotStars <https://www.adafruit.com/category/885>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+from micropython import const
+
+from .pixelbuffer import PixelBuffer, pixel_format
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_LED_Animation.git"
+
+ALPHA = const(0)
+"""Draw lit pixels of the layer over the layers below, mixed by the layer opacity.  Unlit
+pixels are transparent."""
+ADD = const(1)
+"""Add the layer to the layers below, saturating at full brightness."""
+MAX = const(2)
+"""Keep the brighter of the layer and the layers below, for each color."""
+MULTIPLY = const(3)
+"""Multiply the layers below by the layer, so that the layer acts as a mask."""
+
+
+def _blend_alpha(out, src, layer):
+    scale = layer._scale
+    inverse = layer._inverse
+    bpp = layer.bpp
+    unlit = layer._unlit
+    for start in range(0, len(out), bpp):
+        end = start + bpp
+        pixel = src[start:end]
+        if pixel != unlit:
+            out[start:end] = bytes([inverse[a] + scale[b] for a, b in zip(out[start:end], pixel)])
+
+
+def _blend_add(out, src, layer):
+    scale = layer._scale
+    out[:] = bytes([min(a + scale[b], 255) for a, b in zip(out, src)])
+
+
+def _blend_max(out, src, layer):
+    scale = layer._scale
+    out[:] = bytes([max(a, scale[b]) for a, b in zip(out, src)])
+
+
+def _blend_multiply(out, src, layer):
+    multiply = layer._multiply
+    out[:] = bytes([a * multiply[b] // 255 for a, b in zip(out, src)])
+
+
+_BLENDS = (_blend_alpha, _blend_add, _blend_max, _blend_multiply)
+
+
+class Layer(PixelBuffer):
+    """
+    An off-screen layer of a `Compositor`.  Create layers with `Compositor.add_layer()`, and
+    use them as the pixel object of animations, `PixelMap` or `PixelGrid`.  Showing a layer
+    shows the compositor.
+
+    :param Compositor compositor: The compositor the layer belongs to.
+    :param int mode: How the layer is blended with the layers below: ``ALPHA``, ``ADD``,
+                     ``MAX`` or ``MULTIPLY``.
+    :param float opacity: Opacity of the layer, from 0.0 to 1.0.
+    """
+
+    __slots__ = ("_compositor", "_unlit", "_mode", "_opacity", "_scale", "_inverse", "_multiply")
+
+    def __init__(self, compositor, mode=ALPHA, opacity=1.0):
+        super().__init__(compositor.n, pixel_order=compositor.pixel_order, auto_write=False)
+        self._compositor = compositor
+        self._unlit = self.format.pack(0)
+        self._mode = mode
+        self._opacity = None
+        self.opacity = opacity
+
+    @property
+    def mode(self):
+        """
+        How the layer is blended with the layers below: ``ALPHA``, ``ADD``, ``MAX`` or
+        ``MULTIPLY``.
+        """
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode):
+        if mode not in {ALPHA, ADD, MAX, MULTIPLY}:
+            raise ValueError("Unknown blend mode")
+        self._mode = mode
+        self.dirty = True
+
+    @property
+    def opacity(self):
+        """
+        Opacity of the layer, from 0.0 (invisible) to 1.0.
+        """
+        return self._opacity
+
+    @opacity.setter
+    def opacity(self, opacity):
+        opacity = min(max(opacity, 0.0), 1.0)
+        if opacity == self._opacity:
+            return
+        self._opacity = opacity
+        # Lookup tables keep floating point out of blending.
+        self._scale = bytes([int(value * opacity + 0.5) for value in range(256)])
+        self._inverse = bytes([value - self._scale[value] for value in range(256)])
+        self._multiply = bytes([255 - self._scale[255 - value] for value in range(256)])
+        self.dirty = True
+
+    @property
+    def physical_strip(self):
+        """
+        The compositor, which is shown once per frame for all of its layers.
+        """
+        return self._compositor
+
+    def show(self):
+        """
+        Blends the layers of the compositor and shows the result.
+        """
+        self.show_count += 1
+        if self._compositor.dirty:
+            self._compositor.show()
+
+
+class Compositor:
+    """
+    Compositor gives each animation its own off-screen layer, and blends the layers into a
+    pixel object with a single ``show()``, so animations can be layered on the same pixels
+    instead of overwriting each other.  Layers are blended in the order they were added,
+    from the bottom up.
+
+    :param pixel_object: The initialised pixel object to show the blended layers on.
+
+    .. code-block:: python
+
+        import board
+        import neopixel
+        from adafruit_led_animation.animation.rainbow import Rainbow
+        from adafruit_led_animation.animation.sparkle import Sparkle
+        from adafruit_led_animation.compositor import ADD, Compositor
+        from adafruit_led_animation.group import AnimationGroup
+        from adafruit_led_animation.color import WHITE
+
+        pixels = neopixel.NeoPixel(board.D6, 60, brightness=0.5, auto_write=False)
+        compositor = Compositor(pixels)
+
+        rainbow = Rainbow(compositor.add_layer(), speed=0.05)
+        sparkle = Sparkle(compositor.add_layer(ADD, opacity=0.5), speed=0.05, color=WHITE)
+
+        animations = AnimationGroup(rainbow, sparkle)
+
+        while True:
+            animations.animate()
+    """
+
+    __slots__ = (
+        "pixel_object",
+        "n",
+        "pixel_order",
+        "layers",
+        "_output",
+        "bpp",
+        "_blank",
+        "_changed",
+    )
+
+    def __init__(self, pixel_object):
+        self.pixel_object = pixel_object
+        self.n = len(pixel_object)
+        pixel_order = pixel_format(pixel_object).order
+        self.pixel_order = pixel_order
+        self.layers = []
+        """The layers, from the bottom up."""
+        self._output = PixelBuffer(self.n, pixel_order=pixel_order)
+        self.bpp = self._output.bpp
+        self._blank = bytes(self._output._buf)
+        self._changed = False
+
+    def __len__(self):
+        return self.n
+
+    def add_layer(self, mode=ALPHA, opacity=1.0):
+        """
+        Add a layer on top of the existing layers.
+
+        :param int mode: How the layer is blended with the layers below: ``ALPHA``, ``ADD``,
+                         ``MAX`` or ``MULTIPLY``. Defaults to ``ALPHA``.
+        :param float opacity: Opacity of the layer, from 0.0 to 1.0. Defaults to 1.0.
+        :return: The new `Layer`.
+        """
+        layer = Layer(self, mode, opacity)
+        self.layers.append(layer)
+        self._changed = True
+        return layer
+
+    def remove_layer(self, layer):
+        """
+        Remove a layer.
+
+        :param Layer layer: The layer to remove.
+        """
+        self.layers.remove(layer)
+        self._changed = True
+
+    @property
+    def dirty(self):
+        """
+        Whether any layer has changed since the compositor was last shown.
+        """
+        if self._changed:
+            return True
+        for layer in self.layers:
+            if layer.dirty:
+                return True
+        return False
+
+    def blend(self):
+        """
+        Blend the layers into the pixel object, without showing it.
+        """
+        out = self._output._buf
+        out[:] = self._blank
+        for layer in self.layers:
+            if layer.opacity:
+                _BLENDS[layer.mode](out, layer._buf, layer)
+            layer.dirty = False
+        self._changed = False
+        self._output.copy_to(self.pixel_object)
+
+    def show(self):
+        """
+        Blend the layers and show the pixel object.
+        """
+        self.blend()
+        if getattr(self.pixel_object, "dirty", True):
+            self.pixel_object.show()
@@ -27,11 +27,29 @@ Implementation Notes
 
 from micropython import const
 
-from .helper import PixelMap, horizontal_strip_gridmap, vertical_strip_gridmap
+from .helper import PixelMap, _axis, horizontal_strip_gridmap, vertical_strip_gridmap
 
 HORIZONTAL = const(1)
 VERTICAL = const(2)
 
+NORMAL = const(0)
+"""Show the grid as it is laid out."""
+FLIP_X = const(1)
+"""Mirror the grid from left to right."""
+FLIP_Y = const(2)
+"""Mirror the grid from top to bottom."""
+ROTATE_180 = const(3)
+"""Rotate the grid by 180 degrees."""
+TRANSPOSE = const(4)
+"""Swap the x and y coordinates, mirroring the grid along its top left to bottom right
+diagonal."""
+ROTATE_90 = const(5)
+"""Rotate the grid by 90 degrees clockwise."""
+ROTATE_270 = const(6)
+"""Rotate the grid by 270 degrees clockwise."""
+TRANSVERSE = const(7)
+"""Mirror the grid along its top right to bottom left diagonal."""
+
 
 class PixelGrid:
     """
@@ -46,6 +64,7 @@ class PixelGrid:
     :param reverse_y: Whether the strip Y origin is on the bottom (default False).
     :param tuple top: (x, y) coordinates of grid top left corner (Optional)
     :param tuple bottom: (x, y) coordinates of grid bottom right corner (Optional)
+    :param int transform: Rotation or mirroring of the grid, see `transform` (default NORMAL).
 
     To use with individual pixels:
 
@@ -66,8 +85,43 @@ class PixelGrid:
                 pg[x][y] = ((y*32) + x) << 8
         pg.show()
 
+    The grid compiles its layout into a single table of strip indices when it is created.  Rows,
+    columns, rectangles and whole frames can be written in one call, using slice assignments on
+    the strip wherever the layout puts the pixels next to each other:
+
+    .. code-block:: python
+
+        grid.fill_row(0, (255, 0, 0))
+        grid.fill_column(31, (0, 255, 0))
+        grid.fill_rect(4, 2, 8, 4, (0, 0, 255))
+        grid.blit(frame)  # width * height colors, row by row
+
+    Rectangles, rows and columns can also be read and written with slices.  A region is set to
+    a single color, or to a sequence with a color for each pixel, row by row.  Reading a region
+    returns a list of colors, row by row:
+
+    .. code-block:: python
+
+        grid[4:12, 2:6] = (0, 0, 255)  # fill a rectangle
+        grid[:, 0] = (255, 0, 0)  # fill the top row
+        grid[31, :] = column_colors  # set the last column, top to bottom
+        top_left = grid[0:8, 0:8]
+
     """
 
+    __slots__ = (
+        "_pixels",
+        "_map",
+        "_lut",
+        "_row_major",
+        "_columns",
+        "_layouts",
+        "_transform",
+        "height",
+        "width",
+        "n",
+    )
+
     def __init__(
         self,
         strip,
@@ -79,9 +133,8 @@ class PixelGrid:
         reverse_y=False,
         top=0,
         bottom=0,
+        transform=NORMAL,
     ):
-        self._pixels = strip
-        self._x = []
         self.height = height
         self.width = width
 
@@ -108,39 +161,189 @@ class PixelGrid:
         self.height = y_end - y_start
         self.width = x_end - x_start
 
-        for x in range(x_start, x_end):
-            self._x.append(
-                PixelMap(
-                    strip,
-                    [mapper(x, y) for y in range(y_start, y_end)],
-                    individual_pixels=True,
-                )
-            )
-        self.n = len(self._x)
+        # The strip index of every pixel, in one table.  Pixels are stored row by row if the
+        # strip runs horizontally, or column by column if it runs vertically, so that lines of
+        # pixels along the strip are runs in the table.
+        row_major = orientation == HORIZONTAL
+        if row_major:
+            lut = [mapper(x, y) for y in range(y_start, y_end) for x in range(x_start, x_end)]
+        else:
+            lut = [mapper(x, y) for x in range(x_start, x_end) for y in range(y_start, y_end)]
+        layout = self._new_layout(strip, lut, row_major, self.width, self.height)
+        self._pixels = layout[0]._pixels
+        # The table, line order, width, height and columns for each transform that has been used.
+        self._layouts = {NORMAL: layout}
+        self._transform = None
+        self.transform = transform
 
     def __repr__(self):
         return "[" + ", ".join([str(self[x]) for x in range(self.n)]) + "]"
 
+    @staticmethod
+    def _new_layout(strip, lut, row_major, width, height):
+        return (
+            PixelMap(strip, lut, individual_pixels=True),
+            row_major,
+            width,
+            height,
+            [None] * width,
+        )
+
+    @property
+    def transform(self):
+        """
+        Rotation or mirroring of the grid: ``NORMAL``, ``ROTATE_90``, ``ROTATE_180``,
+        ``ROTATE_270``, ``FLIP_X``, ``FLIP_Y``, ``TRANSPOSE`` or ``TRANSVERSE``.  Rotating a grid
+        by 90 or 270 degrees swaps its ``width`` and ``height``.
+
+        The table of strip indices for each transform is built the first time the transform is
+        used and kept, so switching back and forth between transforms does not allocate.  Use
+        `prepare_transforms()` to build them up front.  Columns returned by ``grid[x]`` follow
+        the transform that was set when they were returned.
+        """
+        return self._transform
+
+    @transform.setter
+    def transform(self, transform):
+        if transform == self._transform:
+            return
+        if transform not in self._layouts:
+            self.prepare_transforms(transform)
+        (
+            self._map,
+            self._row_major,
+            self.width,
+            self.height,
+            self._columns,
+        ) = self._layouts[transform]
+        self._lut = self._map._indices
+        self.n = self.width
+        self._transform = transform
+
+    def prepare_transforms(self, *transforms):
+        """
+        Build the tables for transforms ahead of time, so that setting `transform` later is
+        instant and does not allocate memory.
+
+        :param transforms: The transforms to prepare.
+        """
+        for transform in transforms:
+            if transform not in range(8):
+                raise ValueError("Unknown transform")
+            if transform not in self._layouts:
+                self._layouts[transform] = self._transformed_layout(transform)
+
+    def _transformed_layout(self, transform):
+        # Permutes the untransformed table.  Flips only reverse the runs along the strip, but
+        # swapping x and y swaps which of rows or columns run along the strip.
+        base, base_row_major, width, height, _ = self._layouts[NORMAL]
+        base = base._indices
+        transposed = transform & TRANSPOSE
+        flip_x = transform & FLIP_X
+        flip_y = transform & FLIP_Y
+
+        def strip_index(x, y):
+            if transposed:
+                x, y = y, x
+            if flip_x:
+                x = width - 1 - x
+            if flip_y:
+                y = height - 1 - y
+            return base[y * width + x if base_row_major else x * height + y]
+
+        new_width, new_height = (height, width) if transposed else (width, height)
+        row_major = base_row_major != bool(transposed)
+        if row_major:
+            lut = [strip_index(x, y) for y in range(new_height) for x in range(new_width)]
+        else:
+            lut = [strip_index(x, y) for x in range(new_width) for y in range(new_height)]
+        return self._new_layout(self._pixels, lut, row_major, new_width, new_height)
+
+    def _position(self, x, y):
+        if x < 0:
+            x += self.width
+        if x >= self.width or x < 0:
+            raise IndexError("x is out of range")
+        if y < 0:
+            y += self.height
+        if y >= self.height or y < 0:
+            raise IndexError("y is out of range")
+        if self._row_major:
+            return y * self.width + x
+        return x * self.height + y
+
     def __setitem__(self, index, val):
         if isinstance(index, slice):
-            raise NotImplementedError("PixelGrid does not support slices")
-
-        if isinstance(index, tuple):
-            self._x[index[0]][index[1]] = val
+            self._set_region(index, slice(None), val)
+        elif isinstance(index, tuple):
+            x, y = index
+            if isinstance(x, slice) or isinstance(y, slice):
+                self._set_region(x, y, val)
+            else:
+                height = self.height
+                if not (0 <= x < self.width and 0 <= y < height):
+                    position = self._position(x, y)
+                elif self._row_major:
+                    position = y * self.width + x
+                else:
+                    position = x * height + y
+                self._pixels[self._lut[position]] = val
         else:
             raise ValueError("PixelGrid assignment needs a sub-index or x,y coordinate")
 
         if self._pixels.auto_write:
             self.show()
 
+    def _set_region(self, x, y, val):
+        columns = _axis(x, self.width, "x")
+        rows = _axis(y, self.height, "y")
+        if isinstance(val, int) or (isinstance(val, tuple) and isinstance(val[0], (int, float))):
+            colors = None
+            color = val
+        else:
+            if len(val) != len(columns) * len(rows):
+                raise ValueError("Region and input sequence size do not match.")
+            colors = val
+            color = None
+        if not columns or not rows:
+            return
+        if columns.step == 1 and rows.step == 1:
+            self._write_region(columns.start, columns.stop, rows.start, rows.stop, colors, color)
+            return
+        pixels = self._pixels
+        lut = self._lut
+        i = 0
+        for row in rows:
+            for column in columns:
+                pixels[lut[self._position(column, row)]] = color if colors is None else colors[i]
+                i += 1
+
     def __getitem__(self, index):
+        if isinstance(index, tuple):
+            x, y = index
+            if isinstance(x, slice) or isinstance(y, slice):
+                columns = _axis(x, self.width, "x")
+                rows = _axis(y, self.height, "y")
+                pixels = self._pixels
+                lut = self._lut
+                return [pixels[lut[self._position(x, y)]] for y in rows for x in columns]
+            return self._pixels[self._lut[self._position(x, y)]]
         if isinstance(index, slice):
-            raise NotImplementedError("PixelGrid does not support slices")
+            return [self[x] for x in range(*index.indices(self.n))]
         if index < 0:
             index += len(self)
         if index >= self.n or index < 0:
             raise IndexError("x is out of range")
-        return self._x[index]
+        column = self._columns[index]
+        if column is None:
+            # Built the first time the column is used, from the table.
+            column = PixelMap(
+                self._pixels,
+                [self._lut[self._position(index, y)] for y in range(self.height)],
+                individual_pixels=True,
+            )
+            self._columns[index] = column
+        return column
 
     def __len__(self):
         return self.n
@@ -162,8 +365,101 @@ class PixelGrid:
 
         :param color: Color to use.
         """
-        for strip in self._x:
-            strip.fill(color)
+        self._map.fill(color)
+
+    def fill_row(self, y, color):
+        """
+        Fill a row of the PixelGrid with a color.
+
+        :param int y: The row to fill.
+        :param color: Color to use.
+        """
+        if y < 0:
+            y += self.height
+        if y >= self.height or y < 0:
+            raise IndexError("y is out of range")
+        self._write_region(0, self.width, y, y + 1, None, color)
+
+    def fill_column(self, x, color):
+        """
+        Fill a column of the PixelGrid with a color.
+
+        :param int x: The column to fill.
+        :param color: Color to use.
+        """
+        if x < 0:
+            x += self.width
+        if x >= self.width or x < 0:
+            raise IndexError("x is out of range")
+        self._write_region(x, x + 1, 0, self.height, None, color)
+
+    def fill_rect(self, x, y, width, height, color):
+        """
+        Fill a rectangle of the PixelGrid with a color.  Parts of the rectangle outside the grid
+        are ignored.
+
+        :param int x: The left column of the rectangle.
+        :param int y: The top row of the rectangle.
+        :param int width: Width of the rectangle.
+        :param int height: Height of the rectangle.
+        :param color: Color to use.
+        """
+        x_end = min(x + width, self.width)
+        y_end = min(y + height, self.height)
+        x = max(x, 0)
+        y = max(y, 0)
+        if x < x_end and y < y_end:
+            self._write_region(x, x_end, y, y_end, None, color)
+
+    def blit(self, buffer):
+        """
+        Write a whole frame to the PixelGrid.
+
+        :param buffer: A sequence of ``width * height`` colors, row by row from the top left
+                       pixel, for example a list or a `PixelBuffer`.
+        """
+        if len(buffer) != self.width * self.height:
+            raise ValueError("Buffer must have width * height pixels.")
+        self._write_region(0, self.width, 0, self.height, buffer)
+
+    def _write_region(self, x_start, x_end, y_start, y_end, colors, color=None):
+        # Writes a rectangle a line at a time along the strip, so each line is written with as
+        # few slice assignments as the layout allows.  colors holds the colors of the rectangle
+        # row by row, or is None to write color to every pixel.
+        write = self._map._write
+        region_width = x_end - x_start
+        if self._row_major:
+            if region_width == self.width:
+                # Whole rows are contiguous in the table.
+                write(y_start * self.width, y_end * self.width, colors, color)
+                return
+            for y in range(y_start, y_end):
+                first = y * self.width + x_start
+                line = None
+                if colors is not None:
+                    line = colors[(y - y_start) * region_width : (y - y_start + 1) * region_width]
+                write(first, first + region_width, line, color)
+            return
+        region_height = y_end - y_start
+        if region_height == self.height:
+            # Whole columns are contiguous in the table.
+            if colors is not None:
+                colors = [
+                    colors[y * region_width + x]
+                    for x in range(region_width)
+                    for y in range(region_height)
+                ]
+            write(x_start * self.height, x_end * self.height, colors, color)
+            return
+        for x in range(x_start, x_end):
+            first = x * self.height + y_start
+            line = None
+            if colors is not None:
+                line = [
+                    colors[(y - y_start) * region_width + x - x_start]
+                    for y in range(y_start, y_end)
+                ]
+            write(first, first + region_height, line, color)
 
     def show(self):
         """
@@ -171,6 +467,30 @@ class PixelGrid:
         """
         self._pixels.show()
 
+    @property
+    def physical_strip(self):
+        """
+        The pixel object that sends the pixels to the LEDs, looking through any views that the
+        PixelGrid is built on.
+        """
+        return getattr(self._pixels, "physical_strip", self._pixels)
+
+    @property
+    def dirty(self):
+        """
+        Whether any pixel on the underlying strip has changed since it was last shown.
+        ``True`` if the strip does not track changes.
+        """
+        return getattr(self._pixels, "dirty", True)
+
+    def _retarget(self, old, new):
+        for layout in self._layouts.values():
+            layout[0]._retarget(old, new)
+            for column in layout[4]:
+                if column is not None:
+                    column._retarget(old, new)
+        self._pixels = self._map._pixels
+
     @property
     def auto_write(self):
         """
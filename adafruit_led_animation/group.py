@@ -29,7 +29,8 @@ Implementation Notes
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_LED_Animation.git"
 
-from adafruit_led_animation.animation import Animation
+from adafruit_led_animation import ticks_less
+from adafruit_led_animation.helper import FrameCommit
 
 
 class AnimationGroup:
@@ -84,6 +85,19 @@ class AnimationGroup:
                 animations.animate()
     """
 
+    __slots__ = (
+        "draw_count",
+        "cycle_count",
+        "notify_cycles",
+        "_members",
+        "_sync",
+        "_also_notify",
+        "name",
+        "_drawn",
+        "_frame",
+        "on_cycle_complete_supported",
+    )
+
     def __init__(self, *members, sync=False, name=None):
         if not members:
             raise ValueError("At least one member required in an AnimationGroup")
@@ -98,6 +112,8 @@ class AnimationGroup:
         self._also_notify = []
         self.cycle_count = 0
         self.name = name
+        self._drawn = []
+        self._frame = FrameCommit()
         if sync:
             main = members[0]
             main.peers = members[1:]
@@ -142,21 +158,44 @@ class AnimationGroup:
         if self._sync:
             result = self._members[0].animate(show=False)
             if result and show:
-                last_strip = None
-                for member in self._members:
-                    if isinstance(member, Animation):
-                        if last_strip != member.pixel_object:
-                            member.pixel_object.show()
-                            last_strip = member.pixel_object
-                    else:
-                        member.show()
+                self.collect_strips(self._frame)
+                self._frame.show()
             return result
 
-        ret = False
+        drawn = self._drawn
+        drawn.clear()
+        for item in self._members:
+            if item.animate(show=False):
+                drawn.append(item)
+        if drawn and show:
+            self.collect_strips(self._frame)
+            self._frame.show()
+        return bool(drawn)
+
+    def collect_strips(self, frame):
+        """
+        Adds the pixel objects drawn to by the last ``animate()`` call to a `FrameCommit`, so
+        that each strip is shown once per frame.
+
+        :param FrameCommit frame: The frame to add the pixel objects to.
+        """
+        for item in self._members if self._sync else self._drawn:
+            item.collect_strips(frame)
+
+    @property
+    def next_update(self):
+        """
+        The time the next frame of any member is due, in ticks as returned by ``ticks_ms()``,
+        or ``None`` if no member is scheduled.
+        """
+        if self._sync:
+            return self._members[0].next_update
+        earliest = None
         for item in self._members:
-            if item.animate(show):
-                ret = True
-        return ret
+            next_update = item.next_update
+            if next_update is not None and (earliest is None or ticks_less(next_update, earliest)):
+                earliest = next_update
+        return earliest
 
     @property
     def color(self):
@@ -26,12 +26,66 @@ Implementation Notes
 """
 
 import math
+from array import array
+
+from . import monotonic_us
+
+
+def _index_array(values):
+    # Two bytes per index for strips of up to 65536 pixels, four bytes for longer strips.
+    indices = array("I", values)
+    if len(indices) and max(indices) > 0xFFFF:
+        return indices
+    return array("H", indices)
+
+
+def _axis(index, size, name):
+    # The columns or rows of a grid selected by an index or slice.
+    if isinstance(index, slice):
+        return range(*index.indices(size))
+    if index < 0:
+        index += size
+    if index >= size or index < 0:
+        raise IndexError(name + " is out of range")
+    return range(index, index + 1)
+
+
+def _find_runs(indices):
+    # Positions in indices where each run of consecutive strip pixels, ascending or descending,
+    # starts, followed by the length of indices.  None if there are no runs to write as slices.
+    runs = [0]
+    direction = 0
+    for position in range(1, len(indices)):
+        step = indices[position] - indices[position - 1]
+        if direction and step == direction:
+            continue
+        if not direction and step in {1, -1}:
+            direction = step
+            continue
+        runs.append(position)
+        direction = 0
+    if len(runs) == len(indices):
+        return None
+    runs.append(len(indices))
+    return _index_array(runs)
+
+
+def _offset_array(offsets):
+    # None if each mapped pixel is exactly one strip pixel.
+    for pixel in range(1, len(offsets)):
+        if offsets[pixel] - offsets[pixel - 1] != 1:
+            return _index_array(offsets)
+    return None
 
 
 class PixelMap:
     """
     PixelMap lets you treat ranges of pixels as single pixels for animation purposes.
 
+    A PixelMap built on another PixelMap, such as a `PixelSubset` or a `PixelGrid` column, maps
+    straight to the strip that the other PixelMap is built on, so each write costs the same
+    however deeply views are stacked.
+
     :param strip: An object that implements the Neopixel or Dotstar protocol.
     :param iterable pixel_ranges: Pixel ranges (or individual pixels).
     :param bool individual_pixels: Whether pixel_ranges are individual pixels.
@@ -101,60 +155,151 @@ class PixelMap:
 
     """
 
+    __slots__ = ("_pixels", "n", "_indices", "_offsets", "_runs")
+
     def __init__(self, strip, pixel_ranges, individual_pixels=False):
         self._pixels = strip
-        self._ranges = pixel_ranges
 
-        self.n = len(self._ranges)
+        self.n = len(pixel_ranges)
         if self.n == 0:
             raise ValueError("A PixelMap must have at least one pixel defined")
-        self._individual_pixels = individual_pixels
-        self._expand_ranges()
-
-    def _expand_ranges(self):
-        if not self._individual_pixels:
-            self._ranges = [list(range(start, end)) for start, end in self._ranges]
-            return
-        if isinstance(self._ranges[0], int):
-            self._ranges = [[n] for n in self._ranges]
+        if individual_pixels and isinstance(pixel_ranges[0], int):
+            indices = _index_array(pixel_ranges)
+            offsets = None
+        else:
+            if not individual_pixels:
+                pixel_ranges = [range(start, end) for start, end in pixel_ranges]
+            # The pixels of each mapped pixel are _indices[_offsets[i]:_offsets[i + 1]], or
+            # _offsets is None when each mapped pixel is exactly one strip pixel.
+            offsets = [0]
+            for pixels in pixel_ranges:
+                offsets.append(offsets[-1] + len(pixels))
+            indices = _index_array(pixel for pixels in pixel_ranges for pixel in pixels)
+            offsets = _offset_array(offsets)
+        if isinstance(strip, PixelMap):
+            # Map straight to the strip the view is built on, so that writes do not go through
+            # each layer of views.
+            self._pixels = strip._pixels
+            indices, offsets = strip._compose(indices, offsets)
+        self._indices = indices
+        self._offsets = offsets
+        self._runs = _find_runs(indices)
+
+    def _compose(self, indices, offsets):
+        # Converts indices of pixels of this PixelMap, with the offsets of each pixel of a new
+        # PixelMap built on it, to indices and offsets on the strip this PixelMap is built on.
+        own_indices = self._indices
+        own_offsets = self._offsets
+        if own_offsets is None:
+            return _index_array(own_indices[index] for index in indices), offsets
+        strip_indices = []
+        strip_offsets = [0]
+        for pixel in range(len(indices) if offsets is None else len(offsets) - 1):
+            first, last = (pixel, pixel + 1) if offsets is None else offsets[pixel : pixel + 2]
+            for index in indices[first:last]:
+                strip_indices.extend(own_indices[own_offsets[index] : own_offsets[index + 1]])
+            strip_offsets.append(len(strip_indices))
+        return _index_array(strip_indices), _offset_array(strip_offsets)
 
     def __repr__(self):
         return "[" + ", ".join([str(self[x]) for x in range(self.n)]) + "]"
 
     def _set_pixels(self, index, val):
-        for pixel in self._ranges[index]:
-            self._pixels[pixel] = val
+        offsets = self._offsets
+        if offsets is None:
+            self._pixels[self._indices[index]] = val
+            return
+        self._write(offsets[index], offsets[index + 1], None, val)
+
+    def _set_slice(self, start, stop, val):
+        offsets = self._offsets
+        if offsets is None:
+            self._write(start, stop, val)
+            return
+        colors = []
+        for in_i in range(start, stop):
+            colors.extend([val[in_i - start]] * (offsets[in_i + 1] - offsets[in_i]))
+        self._write(offsets[start], offsets[stop], colors)
+
+    def _write(self, first, last, colors, color=None):
+        # Writes to the strip pixels at positions first to last of _indices, with a slice
+        # assignment for each contiguous run.  colors holds a color for each position, or is
+        # None to write color to every position.
+        pixels = self._pixels
+        indices = self._indices
+        runs = self._runs
+        if runs is None:
+            for position in range(first, last):
+                pixels[indices[position]] = color if colors is None else colors[position - first]
+            return
+        # Binary search for the run holding the first position.
+        run = 0
+        high = len(runs) - 1
+        while high - run > 1:
+            middle = (run + high) // 2
+            if runs[middle] <= first:
+                run = middle
+            else:
+                high = middle
+        position = first
+        while position < last:
+            run += 1
+            end = min(runs[run], last)
+            count = end - position
+            pixel = indices[position]
+            if count == 1:
+                pixels[pixel] = color if colors is None else colors[position - first]
+            else:
+                if colors is None:
+                    chunk = [color] * count
+                elif count == len(colors):
+                    chunk = colors
+                else:
+                    chunk = colors[position - first : end - first]
+                if indices[position + 1] > pixel:
+                    pixels[pixel : pixel + count] = chunk
+                else:
+                    pixels[pixel - count + 1 : pixel + 1] = chunk if colors is None else chunk[::-1]
+            position = end
+
+    def _first_pixel(self, index):
+        if self._offsets is None:
+            return self._indices[index]
+        return self._indices[self._offsets[index]]
+
+    def _index(self, index):
+        if index < 0:
+            index += self.n
+        if index >= self.n or index < 0:
+            raise IndexError
+        return index
 
     def __setitem__(self, index, val):
         if isinstance(index, slice):
-            start, stop, step = index.indices(len(self._ranges))
+            start, stop, step = index.indices(self.n)
             length = stop - start
             if step != 0:
                 length = math.ceil(length / step)
             if len(val) != length:
                 raise ValueError("Slice and input sequence size do not match.")
-            for val_i, in_i in enumerate(range(start, stop, step)):
-                self._set_pixels(in_i, val[val_i])
+            if step == 1 and self._runs is not None:
+                self._set_slice(start, stop, val)
+            else:
+                for val_i, in_i in enumerate(range(start, stop, step)):
+                    self._set_pixels(in_i, val[val_i])
         else:
-            self._set_pixels(index, val)
+            self._set_pixels(self._index(index), val)
 
         if self._pixels.auto_write:
             self.show()
 
     def __getitem__(self, index):
         if isinstance(index, slice):
-            out = []
-            for in_i in range(*index.indices(len(self._ranges))):
-                out.append(self._pixels[self._ranges[in_i][0]])
-            return out
-        if index < 0:
-            index += len(self)
-        if index >= self.n or index < 0:
-            raise IndexError
-        return self._pixels[self._ranges[index][0]]
+            return [self._pixels[self._first_pixel(in_i)] for in_i in range(*index.indices(self.n))]
+        return self._pixels[self._first_pixel(self._index(index))]
 
     def __len__(self):
-        return len(self._ranges)
+        return self.n
 
     @property
     def brightness(self):
@@ -173,9 +318,16 @@ class PixelMap:
 
         :param color: Color to fill all pixels referenced by this PixelMap definition with.
         """
-        for pixels in self._ranges:
-            for pixel in pixels:
-                self._pixels[pixel] = color
+        pixels = self._pixels
+        runs = self._runs
+        if runs is None:
+            for pixel in self._indices:
+                pixels[pixel] = color
+        elif len(runs) == 2 and len(self._indices) == len(pixels):
+            # A single run covering the whole strip.
+            pixels.fill(color)
+        else:
+            self._write(0, len(self._indices), None, color)
 
     def show(self):
         """
@@ -183,6 +335,25 @@ class PixelMap:
         """
         self._pixels.show()
 
+    @property
+    def physical_strip(self):
+        """
+        The pixel object that sends the pixels to the LEDs, looking through any views, like
+        this one, that the PixelMap is built on.
+        """
+        return getattr(self._pixels, "physical_strip", self._pixels)
+
+    @property
+    def dirty(self):
+        """
+        Whether any pixel on the underlying strip has changed since it was last shown.
+        ``True`` if the strip does not track changes.
+        """
+        return getattr(self._pixels, "dirty", True)
+
+    def _retarget(self, old, new):
+        self._pixels = retarget(self._pixels, old, new)
+
     @property
     def auto_write(self):
         """
@@ -248,6 +419,119 @@ class PixelMap:
         return cls(pixel_object, mapping, individual_pixels=True)
 
 
+class FrameCommit:
+    """
+    FrameCommit collects the pixel objects drawn to during a frame, and then shows each
+    physical strip once, however many animations or `PixelMap` views drew to it.  Strips that
+    track changes, like `PixelBuffer`, are not shown if none of their pixels changed.  Used by
+    `AnimationGroup` and `AnimationScheduler`.
+
+    The time taken to show each strip is recorded in the ``show`` statistics of the animations
+    that drew to it, for animations that have `FrameStats`.
+
+    .. code-block:: python
+
+        frame = FrameCommit()
+        for animation in (left_comet, right_comet, sparkle):
+            if animation.animate(show=False):
+                animation.collect_strips(frame)
+        frame.show()
+    """
+
+    __slots__ = ("_strips", "_timed")
+
+    def __init__(self):
+        self._strips = []
+        # (position in _strips, animation) for animations recording statistics.
+        self._timed = []
+
+    def add(self, pixel_object, animation=None):
+        """
+        Add a pixel object to the frame.
+
+        :param pixel_object: A pixel object, `PixelMap`, `PixelGrid` or other view.
+        :param animation: The animation that drew to the pixel object, to record the time
+                          taken to show it in. Defaults to ``None``.
+        """
+        strip = getattr(pixel_object, "physical_strip", pixel_object)
+        for position, existing in enumerate(self._strips):
+            if existing is strip:
+                break
+        else:
+            position = len(self._strips)
+            self._strips.append(strip)
+        if animation is not None and animation.stats is not None:
+            for timed in self._timed:
+                if timed[0] == position and timed[1] is animation:
+                    return
+            self._timed.append((position, animation))
+
+    @property
+    def strips(self):
+        """
+        The physical strips added since the last show, each listed once.
+        """
+        return tuple(self._strips)
+
+    def show(self):
+        """
+        Show each strip added since the last show, then start a new frame.
+        """
+        timed = self._timed
+        for position, strip in enumerate(self._strips):
+            if timed:
+                start = monotonic_us()
+            if getattr(strip, "dirty", True):
+                strip.show()
+            if timed:
+                duration = monotonic_us() - start
+                for timed_position, animation in timed:
+                    if timed_position == position:
+                        animation.stats.record_show(duration)
+        self.clear()
+
+    def clear(self):
+        """
+        Start a new frame without showing anything.
+        """
+        self._strips.clear()
+        self._timed.clear()
+
+
+def retarget(pixel_object, old, new):
+    """
+    Redirect a pixel object that draws to the strip ``old``, directly or through `PixelMap` and
+    `PixelGrid` views, to draw to ``new`` instead.  Used by transitions to render animations
+    off-screen.
+
+    :param pixel_object: The pixel object or view.
+    :param old: The strip currently drawn to.
+    :param new: The strip to draw to instead.
+    :return: The pixel object to draw to.
+    """
+    if pixel_object is old:
+        return new
+    if not hasattr(pixel_object, "_retarget"):
+        raise ValueError("Pixel object does not draw to the strip")
+    pixel_object._retarget(old, new)
+    return pixel_object
+
+
+def iter_animations(item):
+    """
+    Yield every animation in an animation, group, sequence or scheduler, including peers.
+
+    :param item: An animation, group, sequence or scheduler.
+    """
+    members = getattr(item, "_members", None)
+    if members is None:
+        yield item
+        yield from item.peers
+    else:
+        for member in members:
+            yield from iter_animations(member)
+
+
 def vertical_strip_gridmap(height, alternating=True):
     """
     Returns a function that determines the pixel number for a grid with strips arranged vertically.
@@ -303,9 +587,7 @@ class PixelSubset(PixelMap):
         pixels.show()
     """
 
+    __slots__ = ()
+
     def __init__(self, pixel_object, start, end):
-        super().__init__(
-            pixel_object,
-            pixel_ranges=[[n] for n in range(start, end)],
-            individual_pixels=True,
-        )
+        super().__init__(pixel_object, pixel_ranges=range(start, end), individual_pixels=True)
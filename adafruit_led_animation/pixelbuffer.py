@@ -0,0 +1,356 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_led_animation.pixelbuffer`
+================================================================================
+
+In-memory pixel object for CircuitPython helper library for LED animations.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+from micropython import const
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_LED_Animation.git"
+
+_PACK_CACHE_SIZE = const(64)
+
+
+class PixelFormat:
+    """
+    Byte layout of the pixels of a strip, as sent to the LEDs.
+
+    :param str order: Order of the bytes of each pixel, e.g. ``"GRB"``, ``"GRBW"``, or ``"PBGR"``
+                      for DotStars, where ``P`` is the header byte of each APA102 pixel.
+    """
+
+    __slots__ = ("order", "bpp", "offsets", "header", "_cache")
+
+    def __init__(self, order="RGB"):
+        order = order.upper()
+        colors = order.replace("P", "")
+        if (
+            len(order) not in {3, 4}
+            or len(colors) < 3
+            or order.count("P") > 1
+            or any(order.count(color) != 1 for color in colors)
+            or any(color not in "RGBWP" for color in order)
+        ):
+            raise ValueError("Unsupported pixel order")
+        self.order = order
+        """Order of the bytes of each pixel."""
+        self.bpp = len(order)
+        """Bytes per pixel, including the header byte if there is one."""
+        self.offsets = tuple(order.index(color) for color in "RGBW"[: len(colors)])
+        """Position of the red, green, blue and white bytes in each pixel."""
+        self.header = order.find("P")
+        """Position of the header byte in each pixel, or -1 if there is none."""
+        self._cache = {}
+
+    def __eq__(self, other):
+        return isinstance(other, PixelFormat) and other.order == self.order
+
+    def __hash__(self):
+        return hash(self.order)
+
+    def pack(self, color):
+        """
+        Convert a color to the bytes of a pixel.  The most recently used colors are cached.
+
+        :param color: Color in ``(r, g, b)`` tuple, or ``0x000000`` hex format.
+        :return: ``bytes`` of length ``bpp``.
+        """
+        try:
+            return self._cache[color]
+        except (KeyError, TypeError):
+            pass
+        key = color
+        if isinstance(color, int):
+            color = (color >> 16 & 0xFF, color >> 8 & 0xFF, color & 0xFF)
+        packed = bytearray(self.bpp)
+        if self.header >= 0:
+            packed[self.header] = 0xFF
+        for offset, value in zip(self.offsets, color):
+            packed[offset] = int(value) & 0xFF
+        packed = bytes(packed)
+        if isinstance(key, (int, tuple)):
+            if len(self._cache) >= _PACK_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[key] = packed
+        return packed
+
+
+def pixel_format(pixel_object):
+    """
+    Detect the `PixelFormat` of a pixel object, from its ``byteorder``, ``pixel_order`` or
+    ``bpp``.
+
+    :param pixel_object: The pixel object, e.g. a NeoPixel or DotStar strip, or a `PixelBuffer`.
+    """
+    if isinstance(pixel_object, PixelBuffer):
+        return pixel_object.format
+    for name in ("byteorder", "pixel_order"):
+        order = getattr(pixel_object, name, None)
+        if isinstance(order, str):
+            return PixelFormat(order)
+    return PixelFormat("RGBW" if getattr(pixel_object, "bpp", 3) == 4 else "RGB")
+
+
+class PixelBuffer:
+    """
+    PixelBuffer is a pixel object that keeps its pixels in a ``bytearray`` instead of sending
+    them to LEDs.  It implements the same protocol as the NeoPixel and DotStar libraries, so
+    animations, `PixelMap` and `PixelGrid` can draw to it without any hardware, for benchmarking
+    and headless rendering.
+
+    :param int n: Number of pixels.
+    :param int bpp: Bytes per pixel, 3 for RGB or 4 for RGBW. Defaults to the length of
+                    ``pixel_order``, or 3.
+    :param str pixel_order: Order of the bytes of each pixel in the buffer, e.g. ``"GRB"``,
+                            ``"GRBW"`` or ``"PBGR"``, see `PixelFormat`. Defaults to ``"RGB"``,
+                            or ``"RGBW"`` if ``bpp`` is 4.
+    :param float brightness: Brightness of the pixels.  Recorded for compatibility, it is not
+                             applied to the buffer. Defaults to 1.0.
+    :param bool auto_write: Whether to call ``show()`` after each change. Defaults to ``False``.
+
+    .. code-block:: python
+
+        from adafruit_led_animation.animation.comet import Comet
+        from adafruit_led_animation.pixelbuffer import PixelBuffer
+
+        pixels = PixelBuffer(10000, pixel_order="GRB")
+        comet = Comet(pixels, 0.01, 0xFF00FF, tail_length=100)
+
+        comet.animate()
+        frame = pixels.buf  # memoryview of the GRB bytes of the frame
+    """
+
+    __slots__ = (
+        "format",
+        "n",
+        "bpp",
+        "pixel_order",
+        "_offsets",
+        "_buf",
+        "_brightness",
+        "auto_write",
+        "show_count",
+        "dirty",
+    )
+
+    def __init__(self, n, *, bpp=None, pixel_order=None, brightness=1.0, auto_write=False):
+        if pixel_order is None:
+            pixel_order = "RGBW" if bpp == 4 else "RGB"
+        self.format = PixelFormat(pixel_order)
+        """The `PixelFormat` of the buffer."""
+        if bpp is not None and bpp != self.format.bpp:
+            raise ValueError("pixel_order must have bpp (3 or 4) bytes")
+        self.n = n
+        self.bpp = self.format.bpp
+        self.pixel_order = self.format.order
+        self._offsets = self.format.offsets
+        self._buf = bytearray(n * self.bpp)
+        if self.format.header >= 0:
+            for header in range(self.format.header, len(self._buf), self.bpp):
+                self._buf[header] = 0xFF
+        self._brightness = 1.0
+        self.brightness = brightness
+        self.auto_write = auto_write
+        self.show_count = 0
+        """Number of times show() has been called."""
+        self.dirty = False
+        """Whether any pixel has changed since the last show()."""
+
+    def __repr__(self):
+        return "[" + ", ".join([str(self[x]) for x in range(self.n)]) + "]"
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def buf(self):
+        """
+        A ``memoryview`` of the pixel bytes, in ``pixel_order``.  Does not copy the buffer.
+        """
+        return memoryview(self._buf)
+
+    def _set(self, start, packed):
+        end = start + self.bpp
+        if self._buf[start:end] != packed:
+            self._buf[start:end] = packed
+            self.dirty = True
+
+    def _unpack(self, index):
+        start = index * self.bpp
+        return tuple(self._buf[start + offset] for offset in self._offsets)
+
+    def _index(self, index):
+        if index < 0:
+            index += self.n
+        if index >= self.n or index < 0:
+            raise IndexError
+        return index
+
+    def __setitem__(self, index, val):
+        bpp = self.bpp
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.n)
+            indices = range(start, stop, step)
+            if len(val) != len(indices):
+                raise ValueError("Slice and input sequence size do not match.")
+            for in_i, color in zip(indices, val):
+                self._set(in_i * bpp, self.format.pack(color))
+        else:
+            self._set(self._index(index) * bpp, self.format.pack(val))
+
+        if self.auto_write:
+            self.show()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._unpack(in_i) for in_i in range(*index.indices(self.n))]
+        return self._unpack(self._index(index))
+
+    @property
+    def brightness(self):
+        """
+        Overall brightness of the pixels, from 0.0 to 1.0.
+        """
+        return self._brightness
+
+    @brightness.setter
+    def brightness(self, brightness):
+        self._brightness = min(max(brightness, 0.0), 1.0)
+        self.dirty = True
+
+    def fill(self, color):
+        """
+        Fill all the pixels with a color.
+
+        :param color: Color in ``(r, g, b)`` tuple, or ``0x000000`` hex format.
+        """
+        packed = self.format.pack(color) * self.n
+        if self._buf != packed:
+            self._buf[:] = packed
+            self.dirty = True
+        if self.auto_write:
+            self.show()
+
+    def copy_to(self, pixel_object):
+        """
+        Copy the pixels to another pixel object of the same length, without showing it.
+
+        :param pixel_object: The pixel object to copy to, for example a NeoPixel strip.
+        """
+        if len(pixel_object) != self.n:
+            raise ValueError("Pixel objects must be the same length.")
+        if isinstance(pixel_object, PixelBuffer):
+            if pixel_object.format != self.format:
+                self._convert_to(pixel_object)
+            elif pixel_object._buf != self._buf:
+                pixel_object._buf[:] = self._buf
+                pixel_object.dirty = True
+            return
+        buf = getattr(pixel_object, "buf", None)
+        if buf is not None and pixel_format(pixel_object) == self.format:
+            # The pixel object already holds packed bytes in the same layout.
+            buf[:] = self._buf
+        else:
+            pixel_object[:] = self[:]
+
+    def _convert_to(self, target):
+        # Reorder the colors a byte lane at a time, instead of a pixel at a time.
+        src = self._buf
+        dest = bytearray(len(target._buf))
+        try:
+            for offset, target_offset in zip(self._offsets, target._offsets):
+                dest[target_offset :: target.bpp] = src[offset :: self.bpp]
+            if target.format.header >= 0:
+                dest[target.format.header :: target.bpp] = b"\xff" * self.n
+        except NotImplementedError:
+            target[:] = self[:]
+            return
+        if dest != target._buf:
+            target._buf[:] = dest
+            target.dirty = True
+
+    def show(self):
+        """
+        Counts the frame in ``show_count``.  There are no LEDs to update.
+        """
+        self.show_count += 1
+        self.dirty = False
+
+
+class ShadowBuffer(PixelBuffer):
+    """
+    ShadowBuffer keeps a copy of a strip's pixels in a ``bytearray`` that animations draw to and
+    read from, and commits the whole frame to the strip in one slice assignment when shown.
+    Animations never read back from the driver, so reads are exact whatever the brightness, and
+    the driver converts color order and brightness once per frame instead of on every pixel
+    write.  Frames where no pixel changed are not sent to the strip at all.
+
+    The frame is kept in the strip's `PixelFormat`, so if the strip exposes its packed pixel
+    bytes as ``buf``, frames are committed with a single memory copy.
+
+    :param strip: The initialised pixel object to commit frames to, e.g. a NeoPixel strip.
+
+    .. code-block:: python
+
+        import board
+        import neopixel
+        from adafruit_led_animation.animation.comet import Comet
+        from adafruit_led_animation.pixelbuffer import ShadowBuffer
+
+        strip = neopixel.NeoPixel(board.D6, 300, brightness=0.2, auto_write=False)
+        pixels = ShadowBuffer(strip)
+        comet = Comet(pixels, 0.01, 0xFF00FF, tail_length=30)
+
+        while True:
+            comet.animate()
+    """
+
+    __slots__ = ("_strip",)
+
+    def __init__(self, strip):
+        self._strip = strip
+        super().__init__(
+            len(strip), pixel_order=pixel_format(strip).order, brightness=strip.brightness
+        )
+        strip.auto_write = False
+        self[:] = strip[:]
+        self.dirty = False
+
+    @property
+    def brightness(self):
+        """
+        Brightness of the strip.
+        """
+        return self._strip.brightness
+
+    @brightness.setter
+    def brightness(self, brightness):
+        self._strip.brightness = min(max(brightness, 0.0), 1.0)
+        # Show the next frame, even if no pixel changes, so the strip is redrawn.
+        self.dirty = True
+
+    def show(self):
+        """
+        Commit the frame to the strip and show it, if any pixel has changed.
+        """
+        if self.dirty:
+            self.copy_to(self._strip)
+            self._strip.show()
+        super().show()
@@ -25,7 +25,7 @@ Implementation Notes
 
 """
 
-from . import MS_PER_SECOND, monotonic_ms
+from . import MS_PER_SECOND, ticks_diff, ticks_ms
 from .color import calculate_intensity
 
 
@@ -40,12 +40,12 @@ def pulse_generator(period: float, animation_object, dotstar_pwm=False):
     half_breath = int(animation_object.breath * MS_PER_SECOND // 2)
     half_period = period // 2
 
-    last_update = monotonic_ms()
+    last_update = ticks_ms()
     cycle_position = 0
     last_pos = 0
     while True:
-        now = monotonic_ms()
-        time_since_last_draw = now - last_update
+        now = ticks_ms()
+        time_since_last_draw = ticks_diff(now, last_update)
         last_update = now
         pos = cycle_position = (cycle_position + time_since_last_draw) % period
         if pos < last_pos:
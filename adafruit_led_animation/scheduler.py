@@ -0,0 +1,230 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_led_animation.scheduler`
+================================================================================
+
+Deadline-aware scheduler for CircuitPython helper library for LED animations.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit NeoPixels <https://www.adafruit.com/category/168>`_
+* `Adafruit DotStars <https://www.adafruit.com/category/885>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+from . import MS_PER_SECOND, get_clock, ticks_add, ticks_diff, ticks_less, ticks_ms
+from .helper import FrameCommit
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_LED_Animation.git"
+
+
+class AnimationScheduler:
+    """
+    AnimationScheduler runs a set of animations, groups and sequences, and sleeps until the
+    next frame of any of them is due instead of polling ``animate()`` continuously.
+
+    :param members: The animation objects, groups or sequences to run.
+    :param float idle_interval: Time in seconds to sleep when no member has a frame scheduled,
+                                for example when every member is frozen, and the longest
+                                ``run()`` waits between checks for changes. Defaults to ``0.1``.
+    :param str name: A human-readable name for the scheduler (optional).
+
+    .. code-block:: python
+
+        import board
+        import neopixel
+        from adafruit_led_animation.animation.comet import Comet
+        from adafruit_led_animation.animation.pulse import Pulse
+        from adafruit_led_animation.scheduler import AnimationScheduler
+        import adafruit_led_animation.color as color
+
+        strip_pixels = neopixel.NeoPixel(board.A1, 60, brightness=0.5, auto_write=False)
+        ring_pixels = neopixel.NeoPixel(board.A2, 12, brightness=0.5, auto_write=False)
+
+        scheduler = AnimationScheduler(
+            Comet(strip_pixels, 0.02, color.PURPLE, tail_length=10),
+            Pulse(ring_pixels, 0.05, color.AMBER, period=3),
+        )
+
+        scheduler.run_forever()
+
+    To run alongside other coroutines, await ``run()`` from an ``asyncio`` task instead:
+
+    .. code-block:: python
+
+        import asyncio
+
+        async def main():
+            animation_task = asyncio.create_task(scheduler.run())
+            await asyncio.gather(animation_task, serve_control_socket(scheduler))
+
+        asyncio.run(main())
+    """
+
+    __slots__ = ("_members", "idle_interval", "name", "_frame", "_wake")
+
+    def __init__(self, *members, idle_interval=0.1, name=None):
+        self._members = list(members)
+        self.idle_interval = idle_interval
+        self.name = name
+        self._frame = FrameCommit()
+        self._wake = None
+
+    def __str__(self):
+        return f"<{self.__class__.__name__}: {self.name}>"
+
+    def add(self, member):
+        """
+        Adds an animation, group or sequence to the scheduler.
+
+        :param member: The animation object, group or sequence to add.
+        """
+        self._members.append(member)
+        self._wake_run()
+
+    def remove(self, member):
+        """
+        Removes an animation, group or sequence from the scheduler.
+
+        :param member: The animation object, group or sequence to remove.
+        """
+        self._members.remove(member)
+        self._wake_run()
+
+    @property
+    def next_update(self):
+        """
+        The time the next frame of any member is due, in ticks as returned by ``ticks_ms()``,
+        or ``None`` if no member is scheduled.
+        """
+        earliest = None
+        for member in self._members:
+            next_update = member.next_update
+            if next_update is not None and (earliest is None or ticks_less(next_update, earliest)):
+                earliest = next_update
+        return earliest
+
+    def time_until_next(self):
+        """
+        Time in seconds until the next frame of any member is due. ``0`` if a frame is already
+        due, or ``None`` if no member is scheduled.
+        """
+        next_update = self.next_update
+        if next_update is None:
+            return None
+        return max(0, ticks_diff(next_update, ticks_ms())) / MS_PER_SECOND
+
+    def animate(self, show=True):
+        """
+        Animates every member that is due.  Call this from your own main loop if you want to do
+        other work between frames, sleeping for up to ``time_until_next()`` seconds in between.
+        Each strip drawn to is shown once, even if several members share it.
+
+        :param bool show: Whether to automatically call show on the pixel objects.
+                          Default ``True``.
+        :return: True if any animation draw cycle was triggered, otherwise False.
+        """
+        ret = False
+        for member in self._members:
+            if member.animate(show=False):
+                member.collect_strips(self._frame)
+                ret = True
+        if show:
+            self._frame.show()
+        else:
+            self._frame.clear()
+        return ret
+
+    def freeze(self):
+        """
+        Freeze all members of the scheduler.
+        """
+        for member in self._members:
+            member.freeze()
+        self._wake_run()
+
+    def resume(self):
+        """
+        Resume all members of the scheduler.
+        """
+        for member in self._members:
+            member.resume()
+        self._wake_run()
+
+    def _wake_run(self):
+        # Wake run() so it works out the next frame again.
+        if self._wake is not None:
+            self._wake.set()
+
+    def run_forever(self):
+        """
+        Animates the members forever, sleeping until the next frame is due between frames.
+        """
+        while True:
+            self._run_frame()
+
+    def run_for(self, seconds):
+        """
+        Animates the members for a number of seconds, as measured by the current clock, sleeping
+        until the next frame is due between frames.  With a `VirtualClock` this renders the
+        members as fast as they can be drawn.
+
+        :param float seconds: How long to animate for, in seconds.
+        """
+        end = ticks_add(ticks_ms(), int(seconds * MS_PER_SECOND))
+        while True:
+            remaining = ticks_diff(end, ticks_ms())
+            if remaining <= 0:
+                return
+            self._run_frame(remaining / MS_PER_SECOND)
+
+    def _run_frame(self, max_delay=None):
+        self.animate()
+        delay = self.time_until_next()
+        if delay is None:
+            delay = self.idle_interval
+        if max_delay is not None:
+            delay = min(delay, max_delay)
+        if delay > 0:
+            get_clock().sleep(delay)
+
+    async def run(self):
+        """
+        Animates the members forever from an ``asyncio`` task, awaiting until the next frame is
+        due between frames so other coroutines can run.  Cancel the task to stop animating.
+        Members can be added, removed, frozen and resumed through the scheduler while the task
+        runs, and take effect straight away.  Other changes to members, such as their speed,
+        take effect within ``idle_interval`` seconds.
+        """
+        import asyncio
+
+        self._wake = asyncio.Event()
+        while True:
+            self._wake.clear()
+            self.animate()
+            delay = self.time_until_next()
+            if delay is None or delay > self.idle_interval:
+                delay = self.idle_interval
+            if delay <= 0:
+                # Always yield to the event loop, even when the next frame is already due.
+                await asyncio.sleep(0)
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
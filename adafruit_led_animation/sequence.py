@@ -30,11 +30,16 @@ import random
 
 from adafruit_led_animation.color import BLACK
 
-from . import MS_PER_SECOND, monotonic_ms
+from . import MS_PER_SECOND, const, ticks_add, ticks_diff, ticks_less, ticks_ms
+from .helper import FrameCommit, iter_animations, retarget
+from .pixelbuffer import PixelBuffer, pixel_format
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_LED_Animation.git"
 
+# Longest time between transition frames when neither animation draws, in milliseconds.
+_TRANSITION_FRAME_MS = const(20)
+
 
 class AnimationSequence:
     """
@@ -52,6 +57,10 @@ class AnimationSequence:
     :param bool advance_on_cycle_complete: Automatically advance when `on_cycle_complete` is
                                            triggered on member animations. All Animations must
                                            support on_cycle_complete to use this.
+    :param Transition transition: A transition from `adafruit_led_animation.transition` to mix
+                                  from each animation to the next, instead of cutting between
+                                  them.  All members must draw to the same pixel object, directly
+                                  or through `PixelMap` or `PixelGrid`.  Defaults to ``None``.
 
     .. code-block:: python
 
@@ -75,6 +84,34 @@ class AnimationSequence:
             animations.animate()
     """
 
+    __slots__ = (
+        "_members",
+        "_advance_interval",
+        "_last_advance",
+        "_current",
+        "auto_clear",
+        "auto_reset",
+        "advance_on_cycle_complete",
+        "clear_color",
+        "_paused",
+        "_paused_at",
+        "_random",
+        "_also_notify",
+        "cycle_count",
+        "notify_cycles",
+        "name",
+        "_color",
+        "on_cycle_complete_supported",
+        "transition",
+        "_outgoing",
+        "_incoming",
+        "_advance_pending",
+        "_transition_start",
+        "_last_mix",
+        "_strip",
+        "_buffers",
+    )
+
     def __init__(
         self,
         *members,
@@ -84,12 +121,13 @@ class AnimationSequence:
         auto_reset=False,
         advance_on_cycle_complete=False,
         name=None,
+        transition=None,
     ):
         if advance_interval and advance_on_cycle_complete:
             raise ValueError("Cannot use both advance_interval and advance_on_cycle_complete.")
         self._members = members
-        self._advance_interval = advance_interval * MS_PER_SECOND if advance_interval else None
-        self._last_advance = monotonic_ms()
+        self._advance_interval = int(advance_interval * MS_PER_SECOND) if advance_interval else None
+        self._last_advance = ticks_ms()
         self._current = 0
         self.auto_clear = auto_clear
         self.auto_reset = auto_reset
@@ -108,8 +146,14 @@ class AnimationSequence:
         for member in self._members:
             member.add_cycle_complete_receiver(self._sequence_complete)
         self.on_cycle_complete_supported = self._members[-1].on_cycle_complete_supported
-
-    on_cycle_complete_supported = True
+        self.transition = transition
+        self._outgoing = None
+        self._incoming = None
+        self._advance_pending = False
+        self._transition_start = 0
+        self._last_mix = 0
+        if transition:
+            self._init_transition()
 
     def __str__(self):
         return f"<{self.__class__.__name__}: {self.name}>"
@@ -126,8 +170,14 @@ class AnimationSequence:
                 callback(self)
 
     def _sequence_complete(self, animation):
-        if self.advance_on_cycle_complete:
-            self._advance()
+        # Only the current animation advances the sequence, not one still transitioning out.
+        if not self.advance_on_cycle_complete or animation is not self.current_animation:
+            return
+        if self._outgoing is not None:
+            # Let the transition finish before moving on.
+            self._advance_pending = True
+            return
+        self._advance()
 
     def add_cycle_complete_receiver(self, callback):
         """
@@ -141,12 +191,110 @@ class AnimationSequence:
     def _auto_advance(self):
         if not self._advance_interval:
             return
-        now = monotonic_ms()
-        if now - self._last_advance > self._advance_interval:
+        now = ticks_ms()
+        if self._advance_due(now):
             self._last_advance = now
             self._advance()
 
+    def _advance_due(self, now):
+        elapsed = ticks_diff(now, self._last_advance)
+        # A last advance in the future has wrapped around, after the sequence went unused for
+        # longer than ticks_diff() can measure.
+        return elapsed > self._advance_interval or elapsed < 0
+
+    def _init_transition(self):
+        frame = FrameCommit()
+        for animation in iter_animations(self):
+            frame.add(animation.pixel_object)
+        strips = frame.strips
+        if len(strips) != 1:
+            raise ValueError("All members must draw to the same pixel object to use a transition.")
+        strip = strips[0]
+        frame.clear()
+        self._retarget(self, strip, strip)
+        self._strip = strip
+        pixel_order = pixel_format(strip).order
+        self._buffers = tuple(PixelBuffer(len(strip), pixel_order=pixel_order) for _ in range(3))
+
+    @staticmethod
+    def _retarget(member, old, new):
+        # A view shared by several animations is retargeted once.
+        views = []
+        for animation in iter_animations(member):
+            pixel_object = animation.pixel_object
+            if any(view is pixel_object for view in views):
+                continue
+            animation.pixel_object = retarget(pixel_object, old, new)
+            views.append(pixel_object)
+
+    def _draw_offscreen(self, member, buffer):
+        # Members can share views, so they only point at their buffer while they draw.
+        strip = self._strip
+        self._retarget(member, strip, buffer)
+        try:
+            return member.animate(show=False)
+        finally:
+            self._retarget(member, buffer, strip)
+
+    def _start_transition(self, outgoing):
+        strip = self._strip
+        outgoing_buffer, incoming_buffer, _ = self._buffers
+        outgoing_buffer[:] = strip[:]
+        if self.auto_clear:
+            incoming_buffer.fill(self.clear_color)
+        else:
+            incoming_buffer[:] = outgoing_buffer[:]
+        self.transition.start(len(outgoing_buffer), outgoing_buffer.bpp)
+        self._outgoing = outgoing
+        self._incoming = self.current_animation
+        self._transition_start = ticks_ms()
+        self._last_mix = None
+
+    def _end_transition(self):
+        self._buffers[1].copy_to(self._strip)
+        if self.auto_reset:
+            self._outgoing.reset()
+        self._outgoing = None
+        self._incoming = None
+
+    def _animate_transition(self, show):
+        now = ticks_ms()
+        elapsed = ticks_diff(now, self._transition_start)
+        outgoing_buffer, incoming_buffer, out = self._buffers
+        drawn = self._draw_offscreen(self._outgoing, outgoing_buffer)
+        drawn = self._draw_offscreen(self._incoming, incoming_buffer) or drawn
+        if elapsed >= self.transition._duration_ms or elapsed < 0:
+            self._end_transition()
+            if self._advance_pending:
+                self._advance()
+        elif (
+            drawn
+            or self._last_mix is None
+            or ticks_diff(now, self._last_mix) >= _TRANSITION_FRAME_MS
+        ):
+            self._last_mix = now
+            progress = elapsed * 256 // self.transition._duration_ms
+            self.transition.mix(out._buf, outgoing_buffer._buf, incoming_buffer._buf, progress)
+            out.copy_to(self._strip)
+        else:
+            return False
+        if show and getattr(self._strip, "dirty", True):
+            self._strip.show()
+        return True
+
     def _advance(self):
+        self._advance_pending = False
+        if self._outgoing is not None:
+            self._end_transition()
+        if self.transition:
+            outgoing = self.current_animation
+            if self._random:
+                self.random()
+            else:
+                self.next()
+            if self.current_animation is not outgoing:
+                self._start_transition(outgoing)
+            return
         if self.auto_reset:
             self.current_animation.reset()
         if self.auto_clear:
@@ -158,8 +306,11 @@ class AnimationSequence:
 
     def activate(self, index):
         """
-        Activates a specific animation.
+        Activates a specific animation.  A transition that is running is ended first.
         """
+        if self._outgoing is not None:
+            self._advance_pending = False
+            self._end_transition()
         if isinstance(index, str):
             self._current = [member.name for member in self._members].index(index)
         else:
@@ -198,8 +349,37 @@ class AnimationSequence:
         """
         if not self._paused and self._advance_interval:
             self._auto_advance()
+        if self._outgoing is not None:
+            return self._animate_transition(show)
         return self.current_animation.animate(show)
 
+    @property
+    def next_update(self):
+        """
+        The time the current animation's next frame or the next automatic advance is due,
+        whichever comes first, in ticks as returned by ``ticks_ms()``.
+        ``None`` if nothing is scheduled.
+        """
+        if self._paused:
+            return None
+        next_update = self.current_animation.next_update
+        if self._outgoing is not None:
+            next_mix = ticks_ms()
+            if self._last_mix is not None:
+                next_mix = ticks_add(self._last_mix, _TRANSITION_FRAME_MS)
+            for candidate in (self._outgoing.next_update, next_mix):
+                if next_update is None or ticks_less(candidate, next_update):
+                    next_update = candidate
+        if self._advance_interval:
+            now = ticks_ms()
+            if self._advance_due(now):
+                next_advance = now
+            else:
+                next_advance = ticks_add(self._last_advance, self._advance_interval + 1)
+            if next_update is None or ticks_less(next_advance, next_update):
+                next_update = next_advance
+        return next_update
+
     @property
     def current_animation(self):
         """
@@ -233,8 +413,10 @@ class AnimationSequence:
         if self._paused:
             return
         self._paused = True
-        self._paused_at = monotonic_ms()
+        self._paused_at = ticks_ms()
         self.current_animation.freeze()
+        if self._outgoing is not None:
+            self._outgoing.freeze()
 
     def resume(self):
         """
@@ -243,10 +425,14 @@ class AnimationSequence:
         if not self._paused:
             return
         self._paused = False
-        now = monotonic_ms()
-        self._last_advance += now - self._paused_at
+        now = ticks_ms()
+        paused_for = ticks_diff(now, self._paused_at)
+        self._last_advance = ticks_add(self._last_advance, paused_for)
+        self._transition_start = ticks_add(self._transition_start, paused_for)
         self._paused_at = 0
         self.current_animation.resume()
+        if self._outgoing is not None:
+            self._outgoing.resume()
 
     def reset(self):
         """
@@ -258,8 +444,23 @@ class AnimationSequence:
         """
         Draws the current animation group members.
         """
+        if self._outgoing is not None:
+            self._strip.show()
+            return
         self.current_animation.show()
 
+    def collect_strips(self, frame):
+        """
+        Adds the pixel objects of the current animation to a `FrameCommit`, so that each strip
+        is shown once per frame.
+
+        :param FrameCommit frame: The frame to add the pixel objects to.
+        """
+        if self._outgoing is not None:
+            frame.add(self._strip)
+            return
+        self.current_animation.collect_strips(frame)
+
 
 class AnimateOnce(AnimationSequence):
     """
@@ -292,6 +493,8 @@ class AnimateOnce(AnimationSequence):
 
     """
 
+    __slots__ = ("_running",)
+
     def __init__(self, *members, **kwargs):
         kwargs["advance_on_cycle_complete"] = True
         kwargs["advance_interval"] = 0
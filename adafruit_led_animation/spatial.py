@@ -0,0 +1,304 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_led_animation.spatial`
+================================================================================
+
+Pixels at physical positions for CircuitPython helper library for LED animations.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit NeoPixels <https://www.adafruit.com/category/168>`_
+* `Adafruit DotStars <https://www.adafruit.com/category/885>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+import math
+from array import array
+
+from .helper import PixelMap, _index_array
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_LED_Animation.git"
+
+
+def _scaled(values, top):
+    # Scale values so that 0 is 0 and top is 255, one byte per value.
+    scale = 255 / top if top > 0 else 0
+    return bytearray([min(int(value * scale + 0.5), 255) for value in values])
+
+
+class SpatialMap(PixelMap):
+    """
+    SpatialMap is a pixel object for LEDs at arbitrary positions, such as a sculpture, with an
+    ``(x, y)`` or ``(x, y, z)`` position for each pixel, in any unit.  It is used like a
+    `PixelMap` of the first ``len(coordinates)`` pixels of the strip.
+
+    When it is created it computes tables with one byte per pixel, from 0 to 255: the position
+    of each pixel along each axis, its distance from the center and its angle around the center.
+    `render()` draws a table through a 256 color palette, shifted by an offset, so moving the
+    offset from frame to frame animates planar sweeps, radial pulses and spherical waves with no
+    trigonometry per pixel.  Tables for other directions and origins can be made at start up with
+    `projection()`, `distances()` and `angles()`.
+
+    The pixels are also sorted into a grid of buckets, so `pixels_within()` and `nearest()` only
+    look at the pixels close to a point.
+
+    :param strip: The pixel object to map, e.g. a NeoPixel strip or a `PixelMap`.
+    :param coordinates: The ``(x, y)`` or ``(x, y, z)`` position of each pixel, in strip order.
+    :param int buckets: Number of buckets along each axis of the bucket grid. Defaults to 4.
+
+    .. code-block:: python
+
+        import board
+        import neopixel
+        from rainbowio import colorwheel
+        from adafruit_led_animation.spatial import SpatialMap
+
+        pixels = neopixel.NeoPixel(board.D6, 150, auto_write=False)
+        sculpture = SpatialMap.load(pixels, "positions.csv")
+
+        rainbow = [colorwheel(i) for i in range(256)]
+        pulse = [0xFF0000 if i < 32 else 0 for i in range(256)]
+
+        offset = 0
+        while True:
+            sculpture.render(sculpture.z, rainbow, offset)  # Rainbow rising up the sculpture.
+            sculpture.show()
+            sculpture.render(sculpture.distance, pulse, offset)  # Red pulse from the center.
+            sculpture.show()
+            offset = (offset + 4) % 256
+    """
+
+    __slots__ = (
+        "_coordinates",
+        "_origin",
+        "_bucket_count",
+        "_bucket_size",
+        "_bucket_starts",
+        "_bucket_pixels",
+        "center",
+        "x",
+        "y",
+        "z",
+        "distance",
+        "angle",
+    )
+
+    def __init__(self, strip, coordinates, buckets=4):
+        if not coordinates:
+            raise ValueError("A SpatialMap needs at least one coordinate")
+        if len(coordinates) > len(strip):
+            raise ValueError("More coordinates than pixels")
+        super().__init__(strip, range(len(coordinates)), individual_pixels=True)
+        self._coordinates = (
+            array("f", [position[0] for position in coordinates]),
+            array("f", [position[1] for position in coordinates]),
+            array("f", [position[2] if len(position) > 2 else 0 for position in coordinates]),
+        )
+        self._origin = tuple(min(axis) for axis in self._coordinates)
+        self.center = tuple((min(axis) + max(axis)) / 2 for axis in self._coordinates)
+        """The ``(x, y, z)`` center of the box around the pixels."""
+        self.x = self.projection(1, 0, 0)
+        """Position of each pixel from left (0) to right (255)."""
+        self.y = self.projection(0, 1, 0)
+        """Position of each pixel from the lowest (0) to the highest (255) y."""
+        self.z = self.projection(0, 0, 1)
+        """Position of each pixel from the lowest (0) to the highest (255) z."""
+        self.distance = self.distances(*self.center)
+        """Distance of each pixel from the center, 255 for the farthest pixel."""
+        self.angle = self.angles(self.center[0], self.center[1])
+        """Angle of each pixel around the z axis through the center, 0 to 255 for a full turn."""
+        self._sort_buckets(buckets)
+
+    @classmethod
+    def load(cls, strip, filename, buckets=4):
+        """
+        Create a SpatialMap from a text file with the position of one pixel per line, in strip
+        order, as ``x,y`` or ``x,y,z``.  Blank lines and lines starting with ``#`` are skipped.
+
+        :param strip: The pixel object to map.
+        :param str filename: The file to read the positions from.
+        :param int buckets: Number of buckets along each axis of the bucket grid. Defaults to 4.
+        """
+        coordinates = []
+        with open(filename) as positions:
+            for line in positions:
+                position = line.strip()
+                if position and not position.startswith("#"):
+                    coordinates.append(tuple(float(value) for value in position.split(",")))
+        return cls(strip, coordinates, buckets)
+
+    def _sort_buckets(self, buckets):
+        # Sort the pixels by bucket, with where the pixels of each bucket start.
+        xs, ys, zs = self._coordinates
+        size = max(max(axis) - low for axis, low in zip(self._coordinates, self._origin))
+        self._bucket_count = buckets
+        self._bucket_size = size / buckets if size > 0 else 1.0
+        keys = [self._bucket(xs[pixel], ys[pixel], zs[pixel]) for pixel in range(len(xs))]
+        starts = [0] * (buckets**3 + 1)
+        for key in keys:
+            starts[key + 1] += 1
+        for key in range(buckets**3):
+            starts[key + 1] += starts[key]
+        self._bucket_starts = _index_array(starts)
+        filled = list(starts)
+        pixels = [0] * len(keys)
+        for pixel, key in enumerate(keys):
+            pixels[filled[key]] = pixel
+            filled[key] += 1
+        self._bucket_pixels = _index_array(pixels)
+
+    def _cell(self, value, axis):
+        cell = int((value - self._origin[axis]) / self._bucket_size)
+        return min(max(cell, 0), self._bucket_count - 1)
+
+    def _bucket(self, x, y, z):
+        count = self._bucket_count
+        return self._cell(x, 0) + count * (self._cell(y, 1) + count * self._cell(z, 2))
+
+    def _layer(self, home, layer):
+        # The buckets that are layer buckets away from the home bucket along any axis.
+        count = self._bucket_count
+        axes = [range(max(cell - layer, 0), min(cell + layer, count - 1) + 1) for cell in home]
+        return [
+            cell_x + count * (cell_y + count * cell_z)
+            for cell_z in axes[2]
+            for cell_y in axes[1]
+            for cell_x in axes[0]
+            if max(abs(cell_x - home[0]), abs(cell_y - home[1]), abs(cell_z - home[2])) == layer
+        ]
+
+    def projection(self, dx, dy, dz=0):
+        """
+        Make a table of the position of each pixel along a direction, from 0 for the pixel
+        farthest back to 255 for the pixel farthest along.  Used with `render()` for a sweep in
+        that direction.
+
+        :param float dx: X part of the direction.
+        :param float dy: Y part of the direction.
+        :param float dz: Z part of the direction. Defaults to 0.
+        :return: ``bytearray`` with one byte per pixel.
+        """
+        xs, ys, zs = self._coordinates
+        values = [xs[pixel] * dx + ys[pixel] * dy + zs[pixel] * dz for pixel in range(len(xs))]
+        low = min(values)
+        return _scaled([value - low for value in values], max(values) - low)
+
+    def distances(self, x, y, z=0):
+        """
+        Make a table of the distance of each pixel from a point, from 0 at the point to 255 for
+        the farthest pixel.  Used with `render()` for a pulse or wave from that point.
+
+        :param float x: X of the point.
+        :param float y: Y of the point.
+        :param float z: Z of the point. Defaults to 0.
+        :return: ``bytearray`` with one byte per pixel.
+        """
+        xs, ys, zs = self._coordinates
+        values = [
+            math.sqrt((xs[pixel] - x) ** 2 + (ys[pixel] - y) ** 2 + (zs[pixel] - z) ** 2)
+            for pixel in range(len(xs))
+        ]
+        return _scaled(values, max(values))
+
+    def angles(self, x, y):
+        """
+        Make a table of the angle of each pixel around a vertical axis through a point, from
+        0 along the x axis to 255, counterclockwise.  Used with `render()` for a spin around
+        that axis.
+
+        :param float x: X of the axis.
+        :param float y: Y of the axis.
+        :return: ``bytearray`` with one byte per pixel.
+        """
+        xs, ys, _ = self._coordinates
+        scale = 128 / math.pi
+        return bytearray(
+            [
+                int(math.atan2(ys[pixel] - y, xs[pixel] - x) * scale + 256.5) & 0xFF
+                for pixel in range(len(xs))
+            ]
+        )
+
+    def render(self, table, palette, offset=0):
+        """
+        Set every pixel to the palette color for its value in a table, minus an offset.  A
+        pixel with value ``v`` is set to ``palette[(v - offset) % 256]``, so increasing the
+        offset moves the palette out along the table.
+
+        :param table: A table of one byte per pixel, such as `x`, `distance` or the result of
+                      `projection()`.
+        :param palette: A sequence of 256 colors.
+        :param int offset: How far to shift the palette along the table. Defaults to 0.
+        """
+        self[:] = [palette[(value - offset) & 0xFF] for value in table]
+
+    def pixels_within(self, x, y, z=0, radius=0):
+        """
+        Find the pixels within a distance of a point.
+
+        :param float x: X of the point.
+        :param float y: Y of the point.
+        :param float z: Z of the point. Defaults to 0.
+        :param float radius: The distance from the point, in the units of the coordinates.
+        :return: A list of pixel indices, in no particular order.
+        """
+        xs, ys, zs = self._coordinates
+        count = self._bucket_count
+        starts = self._bucket_starts
+        bucket_pixels = self._bucket_pixels
+        limit = radius * radius
+        found = []
+        for cell_z in range(self._cell(z - radius, 2), self._cell(z + radius, 2) + 1):
+            for cell_y in range(self._cell(y - radius, 1), self._cell(y + radius, 1) + 1):
+                row = count * (cell_y + count * cell_z)
+                first = starts[row + self._cell(x - radius, 0)]
+                last = starts[row + self._cell(x + radius, 0) + 1]
+                for i in range(first, last):
+                    pixel = bucket_pixels[i]
+                    if (xs[pixel] - x) ** 2 + (ys[pixel] - y) ** 2 + (zs[pixel] - z) ** 2 <= limit:
+                        found.append(pixel)
+        return found
+
+    def nearest(self, x, y, z=0):
+        """
+        Find the pixel closest to a point.
+
+        :param float x: X of the point.
+        :param float y: Y of the point.
+        :param float z: Z of the point. Defaults to 0.
+        :return: The index of the closest pixel.
+        """
+        # Search outwards from the point a layer of buckets at a time, until no bucket further
+        # out could hold a closer pixel.
+        xs, ys, zs = self._coordinates
+        starts = self._bucket_starts
+        bucket_pixels = self._bucket_pixels
+        home = (self._cell(x, 0), self._cell(y, 1), self._cell(z, 2))
+        best = None
+        best_distance = 0
+        for layer in range(self._bucket_count):
+            for key in self._layer(home, layer):
+                for i in range(starts[key], starts[key + 1]):
+                    pixel = bucket_pixels[i]
+                    distance = (xs[pixel] - x) ** 2 + (ys[pixel] - y) ** 2 + (zs[pixel] - z) ** 2
+                    if best is None or distance < best_distance:
+                        best = pixel
+                        best_distance = distance
+            # Any pixel in the next layer out is at least this far from the point.
+            if best is not None and best_distance <= (layer * self._bucket_size) ** 2:
+                break
+        return best
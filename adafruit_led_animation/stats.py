@@ -0,0 +1,266 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_led_animation.stats`
+================================================================================
+
+Frame timing statistics for CircuitPython helper library for LED animations.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit NeoPixels <https://www.adafruit.com/category/168>`_
+* `Adafruit DotStars <https://www.adafruit.com/category/885>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+from array import array
+
+from . import ticks_diff, ticks_ms
+from .helper import iter_animations
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_LED_Animation.git"
+
+
+class Histogram:
+    """
+    Fixed-size histogram of durations in microseconds, with power of two buckets.  Bucket 0
+    counts durations under 1us, bucket ``n`` counts durations from ``2**(n-1)`` up to ``2**n``
+    us, and the last bucket counts everything longer.  Recording never allocates.
+
+    :param int buckets: Number of buckets. Defaults to 24, which covers up to about 4 seconds.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self, buckets=24):
+        self.counts = array("L", [0] * buckets)
+        """Number of durations recorded in each bucket."""
+        self.count = 0
+        """Number of durations recorded."""
+        self.total = 0
+        """Sum of the durations recorded."""
+        self.min = None
+        """Shortest duration recorded."""
+        self.max = None
+        """Longest duration recorded."""
+
+    def record(self, value):
+        """
+        Record a duration.
+
+        :param int value: Duration in microseconds.
+        """
+        value = int(value)
+        last = len(self.counts) - 1
+        bucket = 0
+        remaining = value
+        while remaining > 0 and bucket < last:
+            remaining >>= 1
+            bucket += 1
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, fraction):
+        """
+        Upper bound of the bucket containing the given fraction of the recorded durations,
+        e.g. ``percentile(0.99)``.  ``None`` if nothing has been recorded.
+
+        :param float fraction: Fraction of the durations, from 0.0 to 1.0.
+        """
+        if not self.count:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(1 << bucket, self.max)
+        return self.max
+
+    def snapshot(self):
+        """
+        Return the statistics as a dict.
+        """
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(0.5),
+            "p99": self.percentile(0.99),
+            "buckets": list(self.counts),
+        }
+
+    def reset(self):
+        """
+        Discard all recorded durations.
+        """
+        for bucket in range(len(self.counts)):
+            self.counts[bucket] = 0
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+
+class FrameStats:
+    """
+    Frame timing statistics for an animation, kept in fixed-size histograms so recording
+    has a constant cost and can be left on.  Assign one to an animation's ``stats`` attribute
+    to start recording, or use `enable_stats` for a whole group or sequence.
+
+    Records, in microseconds:
+
+    * ``draw``: time spent in ``draw()`` and ``after_draw()``.
+    * ``show``: time spent in ``show()``.
+    * ``lateness``: how long after its deadline each frame started.
+    * ``jitter``: how far the time between frames differed from the animation speed.
+
+    Lateness and jitter are measured to the millisecond with the animation clock, so they also
+    hold for animations rendered with a `VirtualClock`.
+
+    :param int buckets: Number of buckets in each histogram. Defaults to 24.
+
+    .. code-block:: python
+
+        from adafruit_led_animation.stats import collect_stats, enable_stats
+
+        enable_stats(animations)
+
+        while True:
+            animations.animate()
+            if button_pressed():
+                for animation, stats in collect_stats(animations).items():
+                    print(animation, stats["draw"]["p99"], stats["lateness"]["max"])
+    """
+
+    __slots__ = ("draw", "show", "lateness", "jitter", "_last_frame")
+
+    def __init__(self, buckets=24):
+        self.draw = Histogram(buckets)
+        self.show = Histogram(buckets)
+        self.lateness = Histogram(buckets)
+        self.jitter = Histogram(buckets)
+        self._last_frame = None
+
+    def record_frame(self, lateness_ms, speed_ms, now=None):
+        """
+        Record the start of a frame.  Called by ``Animation.animate()``.
+
+        :param int lateness_ms: How late the frame is, in milliseconds.
+        :param int speed_ms: The animation speed in milliseconds.
+        :param int now: The time the frame started, in ticks as returned by ``ticks_ms()``.
+                        Defaults to the current time.
+        """
+        if now is None:
+            now = ticks_ms()
+        self.lateness.record(max(0, lateness_ms) * 1000)
+        if self._last_frame is not None:
+            self.jitter.record(abs(ticks_diff(now, self._last_frame) - speed_ms) * 1000)
+        self._last_frame = now
+
+    def record_draw(self, duration):
+        """
+        Record the time taken to draw a frame.  Called by ``Animation.animate()``.
+
+        :param int duration: Duration in microseconds.
+        """
+        self.draw.record(duration)
+
+    def record_show(self, duration):
+        """
+        Record the time taken to show a frame.  Called by ``Animation.animate()``.
+
+        :param int duration: Duration in microseconds.
+        """
+        self.show.record(duration)
+
+    def snapshot(self):
+        """
+        Return the statistics as a dict of histogram snapshots.
+        """
+        return {
+            "draw": self.draw.snapshot(),
+            "show": self.show.snapshot(),
+            "lateness": self.lateness.snapshot(),
+            "jitter": self.jitter.snapshot(),
+        }
+
+    def reset(self):
+        """
+        Discard all recorded statistics.
+        """
+        self.draw.reset()
+        self.show.reset()
+        self.lateness.reset()
+        self.jitter.reset()
+        self._last_frame = None
+
+
+def enable_stats(item, buckets=24):
+    """
+    Start recording `FrameStats` for an animation, and for every animation in a group,
+    sequence or scheduler.
+
+    :param item: An animation, group, sequence or scheduler.
+    :param int buckets: Number of buckets in each histogram. Defaults to 24.
+    """
+    for animation in iter_animations(item):
+        if animation.stats is None:
+            animation.stats = FrameStats(buckets)
+
+
+def disable_stats(item):
+    """
+    Stop recording statistics for an animation, and for every animation in a group,
+    sequence or scheduler.
+
+    :param item: An animation, group, sequence or scheduler.
+    """
+    for animation in iter_animations(item):
+        animation.stats = None
+
+
+def collect_stats(item):
+    """
+    Return a snapshot of the statistics of an animation, and of every animation in a group,
+    sequence or scheduler that is recording them.
+
+    :param item: An animation, group, sequence or scheduler.
+    :return: dict of animation to `FrameStats.snapshot()`.
+    """
+    return {
+        animation: animation.stats.snapshot()
+        for animation in iter_animations(item)
+        if animation.stats is not None
+    }
+
+
+def reset_stats(item):
+    """
+    Reset the statistics of an animation, and of every animation in a group, sequence or
+    scheduler.
+
+    :param item: An animation, group, sequence or scheduler.
+    """
+    for animation in iter_animations(item):
+        if animation.stats is not None:
+            animation.stats.reset()
@@ -0,0 +1,348 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_led_animation.tiledgrid`
+================================================================================
+
+Grids built from several LED panels for CircuitPython helper library for LED animations.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit NeoPixels <https://www.adafruit.com/category/168>`_
+* `Adafruit DotStars <https://www.adafruit.com/category/885>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+from .grid import HORIZONTAL, NORMAL, TRANSPOSE, PixelGrid
+from .helper import PixelMap, PixelSubset, _axis, _index_array
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_LED_Animation.git"
+
+_NO_PANEL = 0xFF
+
+
+class Panel:
+    """
+    A rectangular LED panel, or part of a strip arranged in a grid, placed on a `TiledGrid`.
+
+    :param strip: The pixel object the panel is connected to.
+    :param int width: Width of the panel as it is wired, before any transform.
+    :param int height: Height of the panel as it is wired, before any transform.
+    :param int x: Column of the tiled grid that the left edge of the panel is on.
+    :param int y: Row of the tiled grid that the top edge of the panel is on.
+    :param int start: Index on the strip of the first pixel of the panel, for panels that are
+                      chained on one strip. Defaults to 0.
+    :param orientation: Orientation of the panel pixels - HORIZONTAL (default) or VERTICAL.
+    :param alternating: Whether the panel alternates direction from row to row (default True).
+    :param reverse_x: Whether the panel X origin is on the right side (default False).
+    :param reverse_y: Whether the panel Y origin is on the bottom (default False).
+    :param int transform: The transform that turns the panel upright, as for
+                          `PixelGrid.transform`.  Use ``ROTATE_270`` for a panel mounted a quarter
+                          turn clockwise, ``ROTATE_90`` for one mounted a quarter turn
+                          counterclockwise, and ``ROTATE_180`` for one mounted upside down.
+    """
+
+    __slots__ = (
+        "strip",
+        "width",
+        "height",
+        "x",
+        "y",
+        "start",
+        "orientation",
+        "alternating",
+        "reverse_x",
+        "reverse_y",
+        "transform",
+    )
+
+    def __init__(
+        self,
+        strip,
+        width,
+        height,
+        x=0,
+        y=0,
+        start=0,
+        orientation=HORIZONTAL,
+        alternating=True,
+        reverse_x=False,
+        reverse_y=False,
+        transform=NORMAL,
+    ):
+        self.strip = strip
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.start = start
+        self.orientation = orientation
+        self.alternating = alternating
+        self.reverse_x = reverse_x
+        self.reverse_y = reverse_y
+        self.transform = transform
+
+    @property
+    def size(self):
+        """
+        The ``(width, height)`` the panel covers on the tiled grid, after its transform.
+        """
+        if self.transform & TRANSPOSE:
+            return self.height, self.width
+        return self.width, self.height
+
+    def _grid(self):
+        return PixelGrid(
+            PixelSubset(self.strip, self.start, self.start + self.width * self.height),
+            self.width,
+            self.height,
+            orientation=self.orientation,
+            alternating=self.alternating,
+            reverse_x=self.reverse_x,
+            reverse_y=self.reverse_y,
+            transform=self.transform,
+        )
+
+
+class TiledGrid:
+    """
+    TiledGrid lets you address several LED panels as a single grid with x and y coordinates.
+    Each panel has its own position, wiring and orientation, and can be on its own strip or
+    chained with other panels on a shared strip.  Pixels of the grid that are not on any panel
+    are ignored when written and read as 0.
+
+    The layout is compiled into tables when the grid is created.  Writing a whole frame with
+    `blit()` writes each strip once, in strip order, using slice assignments wherever panels
+    are chained along the strip.
+
+    :param panels: The `Panel` objects that make up the grid.
+
+    .. code-block:: python
+
+        import board
+        import neopixel
+        from adafruit_led_animation.grid import ROTATE_180
+        from adafruit_led_animation.tiledgrid import Panel, TiledGrid
+
+        left = neopixel.NeoPixel(board.D5, 512, auto_write=False)
+        right = neopixel.NeoPixel(board.D6, 256, auto_write=False)
+
+        # Two panels chained on the left strip, and one upside down panel on the right strip.
+        grid = TiledGrid(
+            Panel(left, 16, 16, x=0, y=0),
+            Panel(left, 16, 16, x=16, y=0, start=256),
+            Panel(right, 16, 16, x=32, y=0, transform=ROTATE_180),
+        )
+
+        grid[40, 8] = (255, 0, 0)
+        grid.show()
+    """
+
+    __slots__ = ("_strips", "_panel_strip", "_panel_index", "_outputs", "width", "height", "n")
+
+    def __init__(self, *panels):
+        if not panels:
+            raise ValueError("A TiledGrid must have at least one panel")
+        self.width = max(panel.x + panel.size[0] for panel in panels)
+        self.height = max(panel.y + panel.size[1] for panel in panels)
+        self.n = self.width
+
+        # The strip number and strip index of each pixel of the grid, row by row.
+        self._panel_strip = bytearray([_NO_PANEL]) * (self.width * self.height)
+        panel_index = [0] * (self.width * self.height)
+        self._strips = []
+        pixels = []
+        for panel in panels:
+            grid = panel._grid()
+            strip = grid._pixels
+            for number, existing in enumerate(self._strips):
+                if existing is strip:
+                    break
+            else:
+                number = len(self._strips)
+                if number == _NO_PANEL:
+                    raise ValueError("Too many strips")
+                self._strips.append(strip)
+                pixels.append([])
+            for y in range(grid.height):
+                for x in range(grid.width):
+                    position = (panel.y + y) * self.width + panel.x + x
+                    if self._panel_strip[position] != _NO_PANEL:
+                        raise ValueError("Panels overlap")
+                    index = grid._lut[grid._position(x, y)]
+                    self._panel_strip[position] = number
+                    panel_index[position] = index
+                    pixels[number].append((index, position))
+        self._panel_index = _index_array(panel_index)
+
+        # For each strip, its pixels in strip order, and where each one is on the grid.
+        self._outputs = []
+        for strip, strip_pixels in zip(self._strips, pixels):
+            strip_pixels.sort()
+            self._outputs.append(
+                (
+                    PixelMap(strip, [index for index, _ in strip_pixels], individual_pixels=True),
+                    _index_array(position for _, position in strip_pixels),
+                )
+            )
+
+    def _position(self, x, y):
+        if x < 0:
+            x += self.width
+        if x >= self.width or x < 0:
+            raise IndexError("x is out of range")
+        if y < 0:
+            y += self.height
+        if y >= self.height or y < 0:
+            raise IndexError("y is out of range")
+        return y * self.width + x
+
+    def __setitem__(self, index, val):
+        if not isinstance(index, tuple):
+            raise ValueError("TiledGrid assignment needs an x,y coordinate")
+        x, y = index
+        if isinstance(x, slice) or isinstance(y, slice):
+            self._set_region(x, y, val)
+        else:
+            position = self._position(x, y)
+            number = self._panel_strip[position]
+            if number != _NO_PANEL:
+                self._strips[number][self._panel_index[position]] = val
+
+        if self.auto_write:
+            self.show()
+
+    def _set_region(self, x, y, val):
+        columns = _axis(x, self.width, "x")
+        rows = _axis(y, self.height, "y")
+        single = isinstance(val, int) or (
+            isinstance(val, tuple) and isinstance(val[0], (int, float))
+        )
+        if not single and len(val) != len(columns) * len(rows):
+            raise ValueError("Region and input sequence size do not match.")
+        strips = self._strips
+        panel_strip = self._panel_strip
+        panel_index = self._panel_index
+        i = 0
+        for row in rows:
+            for column in columns:
+                position = row * self.width + column
+                number = panel_strip[position]
+                if number != _NO_PANEL:
+                    strips[number][panel_index[position]] = val if single else val[i]
+                i += 1
+
+    def __getitem__(self, index):
+        if not isinstance(index, tuple):
+            raise ValueError("TiledGrid needs an x,y coordinate")
+        x, y = index
+        if isinstance(x, slice) or isinstance(y, slice):
+            columns = _axis(x, self.width, "x")
+            rows = _axis(y, self.height, "y")
+            return [self._get(row * self.width + column) for row in rows for column in columns]
+        return self._get(self._position(x, y))
+
+    def _get(self, position):
+        number = self._panel_strip[position]
+        if number == _NO_PANEL:
+            return 0
+        return self._strips[number][self._panel_index[position]]
+
+    def __len__(self):
+        return self.n
+
+    def blit(self, buffer):
+        """
+        Write a whole frame to the grid, one strip at a time.
+
+        :param buffer: A sequence of ``width * height`` colors, row by row from the top left
+                       pixel, for example a list or a `PixelBuffer`.
+        """
+        if len(buffer) != self.width * self.height:
+            raise ValueError("Buffer must have width * height pixels.")
+        for strip_map, positions in self._outputs:
+            strip_map[:] = [buffer[position] for position in positions]
+
+    def fill(self, color):
+        """
+        Fill every panel of the grid with a color.
+
+        :param color: Color to use.
+        """
+        for strip_map, _ in self._outputs:
+            strip_map.fill(color)
+
+    def show(self):
+        """
+        Shows the pixels on each strip that has changed.
+        """
+        for strip in self._strips:
+            if getattr(strip, "dirty", True):
+                strip.show()
+
+    @property
+    def physical_strip(self):
+        """
+        The pixel object that sends the pixels to the LEDs when all panels are on one strip,
+        looking through any views the strip is built on.  With panels on several strips, the
+        TiledGrid itself, which shows each of its strips.
+        """
+        if len(self._strips) == 1:
+            strip = self._strips[0]
+            return getattr(strip, "physical_strip", strip)
+        return self
+
+    @property
+    def strips(self):
+        """
+        The pixel objects of the panels, each listed once.
+        """
+        return tuple(self._strips)
+
+    @property
+    def dirty(self):
+        """
+        Whether any pixel on any strip has changed since it was last shown. ``True`` if a
+        strip does not track changes.
+        """
+        for strip in self._strips:
+            if getattr(strip, "dirty", True):
+                return True
+        return False
+
+    @property
+    def brightness(self):
+        """
+        brightness of the strips.
+        """
+        return self._strips[0].brightness
+
+    @brightness.setter
+    def brightness(self, brightness):
+        for strip in self._strips:
+            strip.brightness = min(max(brightness, 0.0), 1.0)
+
+    @property
+    def auto_write(self):
+        """
+        auto_write of the strips.
+        """
+        return self._strips[0].auto_write
+
+    @auto_write.setter
+    def auto_write(self, value):
+        for strip in self._strips:
+            strip.auto_write = value
@@ -58,6 +58,8 @@ class TimedAnimationSequence(AnimationSequence):
             animations.animate()
     """
 
+    __slots__ = ("_animation_members", "_animation_timings")
+
     def __init__(self, *members, auto_clear=True, random_order=False, auto_reset=False, name=None):
         self._animation_members = []
         self._animation_timings = []
@@ -75,8 +77,8 @@ class TimedAnimationSequence(AnimationSequence):
             advance_on_cycle_complete=False,
             name=name,
         )
-        self._advance_interval = self._animation_timings[self._current] * MS_PER_SECOND
+        self._advance_interval = int(self._animation_timings[self._current] * MS_PER_SECOND)
 
     def activate(self, index):
         super().activate(index)
-        self._advance_interval = self._animation_timings[self._current] * MS_PER_SECOND
+        self._advance_interval = int(self._animation_timings[self._current] * MS_PER_SECOND)
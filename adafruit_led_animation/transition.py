@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_led_animation.transition`
+================================================================================
+
+Transitions between animations for CircuitPython helper library for LED animations.
+
+Pass a transition to `AnimationSequence` to mix from one animation to the next instead of cutting
+between them.  Both animations keep running during the transition, each drawing to its own
+`PixelBuffer`.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit NeoPixels <https://www.adafruit.com/category/168>`_
+* `Adafruit DotStars <https://www.adafruit.com/category/885>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+import random
+from array import array
+
+from . import MS_PER_SECOND
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_LED_Animation.git"
+
+
+class Transition:
+    """
+    Base class for transitions.  Subclasses implement ``mix()``.
+
+    :param float duration: Length of the transition in seconds.
+    """
+
+    __slots__ = ("_duration_ms", "_n", "_bpp")
+
+    def __init__(self, duration=1.0):
+        self.duration = duration
+
+    @property
+    def duration(self):
+        """
+        Length of the transition in seconds.
+        """
+        return self._duration_ms / MS_PER_SECOND
+
+    @duration.setter
+    def duration(self, duration):
+        self._duration_ms = max(1, int(duration * MS_PER_SECOND))
+
+    def start(self, n, bpp):
+        """
+        Called when a transition starts, to prepare for mixing.
+
+        :param int n: Number of pixels.
+        :param int bpp: Bytes per pixel.
+        """
+        self._n = n
+        self._bpp = bpp
+
+    def mix(self, out, outgoing, incoming, progress):
+        """
+        Mix two frames.  Called for every frame of the transition, so must not allocate.
+
+        :param bytearray out: Buffer to write the mixed frame to.
+        :param bytearray outgoing: Frame of the animation being transitioned from.
+        :param bytearray incoming: Frame of the animation being transitioned to.
+        :param int progress: How far through the transition, from 0 to 256.
+        """
+        raise NotImplementedError()
+
+
+class Crossfade(Transition):
+    """
+    Fade from one animation to the next.
+
+    :param float duration: Length of the transition in seconds. Defaults to 1.0.
+    """
+
+    __slots__ = ()
+
+    def mix(self, out, outgoing, incoming, progress):
+        remaining = 256 - progress
+        for i in range(len(out)):
+            out[i] = (outgoing[i] * remaining + incoming[i] * progress) >> 8
+
+
+class Wipe(Transition):
+    """
+    Wipe the next animation across the pixels, from the first pixel to the last.
+
+    :param float duration: Length of the transition in seconds. Defaults to 1.0.
+    :param bool reverse: Wipe from the last pixel to the first. Defaults to ``False``.
+    """
+
+    __slots__ = ("reverse",)
+
+    def __init__(self, duration=1.0, reverse=False):
+        super().__init__(duration)
+        self.reverse = reverse
+
+    def mix(self, out, outgoing, incoming, progress):
+        edge = (self._n * progress >> 8) * self._bpp
+        if self.reverse:
+            edge = len(out) - edge
+            first, second = outgoing, incoming
+        else:
+            first, second = incoming, outgoing
+        for i in range(edge):
+            out[i] = first[i]
+        for i in range(edge, len(out)):
+            out[i] = second[i]
+
+
+class Dissolve(Transition):
+    """
+    Switch pixels from one animation to the next in a random order.
+
+    :param float duration: Length of the transition in seconds. Defaults to 1.0.
+    """
+
+    __slots__ = ("_order",)
+
+    def __init__(self, duration=1.0):
+        super().__init__(duration)
+        self._order = array("L")
+
+    def start(self, n, bpp):
+        super().start(n, bpp)
+        # The position of each pixel in a random order, reallocated only if the length changes.
+        if len(self._order) != n:
+            self._order = array("L", range(n))
+        order = self._order
+        for i in range(n - 1, 0, -1):
+            j = random.randint(0, i)
+            order[i], order[j] = order[j], order[i]
+
+    def mix(self, out, outgoing, incoming, progress):
+        switched = self._n * progress >> 8
+        bpp = self._bpp
+        order = self._order
+        for pixel in range(self._n):
+            source = incoming if order[pixel] < switched else outgoing
+            start = pixel * bpp
+            for i in range(start, start + bpp):
+                out[i] = source[i]
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+This example uses a Compositor to layer white sparkles over a rainbow on the same NeoPixels,
+showing both animations with a single show() each frame.
+
+For NeoPixel FeatherWing. Update pixel_pin and pixel_num to match your wiring if using
+a different form of NeoPixels.
+"""
+
+import board
+import neopixel
+
+from adafruit_led_animation.animation.rainbow import Rainbow
+from adafruit_led_animation.animation.sparkle import Sparkle
+from adafruit_led_animation.color import WHITE
+from adafruit_led_animation.compositor import ADD, Compositor
+from adafruit_led_animation.group import AnimationGroup
+
+# Update to match the pin connected to your NeoPixels
+pixel_pin = board.D6
+# Update to match the number of NeoPixels you have connected
+pixel_num = 32
+
+pixels = neopixel.NeoPixel(pixel_pin, pixel_num, brightness=0.5, auto_write=False)
+
+compositor = Compositor(pixels)
+rainbow = Rainbow(compositor.add_layer(), speed=0.05, period=5)
+sparkle = Sparkle(compositor.add_layer(ADD, opacity=0.7), speed=0.05, color=WHITE, num_sparkles=3)
+
+animations = AnimationGroup(rainbow, sparkle)
+
+while True:
+    animations.animate()
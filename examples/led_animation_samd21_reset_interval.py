@@ -15,6 +15,9 @@ using a different board or form of NeoPixels.
 
 This example will run on SAMD21 (M0) Express boards (such as Circuit Playground Express or QT Py
 Haxpress), but not on SAMD21 non-Express boards (such as QT Py or Trinket).
+
+On CircuitPython versions that provide supervisor.ticks_ms(), the library times animations with it
+and does not slow down over time, so the reset is not needed.
 """
 
 import time
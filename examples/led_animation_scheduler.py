@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+This example uses AnimationScheduler to run two animations at different speeds on two pixel
+objects, sleeping between frames instead of polling animate() in a busy loop.
+
+For NeoPixel FeatherWing and a 12-pixel NeoPixel ring. Update the pins and pixel counts to match
+your wiring if using a different form of NeoPixels.
+"""
+
+import board
+import neopixel
+
+from adafruit_led_animation.animation.comet import Comet
+from adafruit_led_animation.animation.pulse import Pulse
+from adafruit_led_animation.color import AMBER, PURPLE
+from adafruit_led_animation.scheduler import AnimationScheduler
+
+# Update to match the pins connected to your NeoPixels
+wing_pin = board.D6
+ring_pin = board.D5
+
+wing_pixels = neopixel.NeoPixel(wing_pin, 32, brightness=0.5, auto_write=False)
+ring_pixels = neopixel.NeoPixel(ring_pin, 12, brightness=0.5, auto_write=False)
+
+comet = Comet(wing_pixels, speed=0.02, color=PURPLE, tail_length=10, bounce=True)
+pulse = Pulse(ring_pixels, speed=0.05, color=AMBER, period=3)
+
+scheduler = AnimationScheduler(comet, pulse)
+
+scheduler.run_forever()
@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+import adafruit_led_animation
+from adafruit_led_animation import VirtualClock
+
+
+@pytest.fixture
+def clock():
+    """A `VirtualClock` that animations read the time from, for the length of a test."""
+    original = adafruit_led_animation.get_clock()
+    clock = VirtualClock()
+    adafruit_led_animation.set_clock(clock)
+    yield clock
+    adafruit_led_animation.set_clock(original)
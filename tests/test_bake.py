@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_led_animation.animation.chase import Chase
+from adafruit_led_animation.animation.comet import Comet
+from adafruit_led_animation.pixelbuffer import PixelBuffer
+
+
+def _frames(animations, clock, count):
+    frames = []
+    for _ in range(count):
+        clock.advance(0.1)
+        for animation in animations:
+            animation.animate()
+        frames.append([animation.pixel_object[:] for animation in animations])
+    return frames
+
+
+@pytest.mark.parametrize(
+    "make, change",
+    [
+        (lambda pixels: Chase(pixels, 0.1, 0xFF0000, size=2, spacing=3), {"reverse": True}),
+        (lambda pixels: Comet(pixels, 0.1, 0xFF0000, tail_length=4), {"reverse": True}),
+        (lambda pixels: Comet(pixels, 0.1, 0xFF0000, tail_length=4), {"bounce": True}),
+    ],
+)
+def test_baked_output_follows_changes(clock, make, change):
+    baked = make(PixelBuffer(10))
+    live = make(PixelBuffer(10))
+    assert baked.bake()
+    _frames([baked, live], clock, 7)
+
+    for name, value in change.items():
+        setattr(baked, name, value)
+        setattr(live, name, value)
+
+    for baked_frame, live_frame in _frames([baked, live], clock, 40):
+        assert baked_frame == live_frame
@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from adafruit_led_animation.pixelbuffer import PixelBuffer, ShadowBuffer
+
+
+def test_brightness_change_is_shown():
+    strip = PixelBuffer(10)
+    shadow = ShadowBuffer(strip)
+    shadow.fill(0xFF0000)
+    shadow.show()
+
+    shadow.brightness = 0.2
+    shadow.show()
+
+    assert strip.brightness == 0.2
+    assert strip.show_count == 2
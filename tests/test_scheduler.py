@@ -0,0 +1,24 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+
+from adafruit_led_animation.animation.colorcycle import ColorCycle
+from adafruit_led_animation.pixelbuffer import PixelBuffer
+from adafruit_led_animation.scheduler import AnimationScheduler
+
+
+def test_run_wakes_for_added_member():
+    async def added_member_draws():
+        slow = ColorCycle(PixelBuffer(3), 5.0)
+        scheduler = AnimationScheduler(slow, idle_interval=5.0)
+        task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.05)
+        fast = ColorCycle(PixelBuffer(3), 0.01)
+        scheduler.add(fast)
+        await asyncio.sleep(0.2)
+        task.cancel()
+        return fast.draw_count
+
+    assert asyncio.run(added_member_draws()) > 0
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_led_animation.animation.colorcycle import ColorCycle
+from adafruit_led_animation.helper import PixelMap
+from adafruit_led_animation.pixelbuffer import PixelBuffer
+from adafruit_led_animation.sequence import AnimateOnce, AnimationSequence
+from adafruit_led_animation.transition import Crossfade
+
+
+def _advances(sequence, clock, seconds, step=0.01):
+    # Times at which the sequence moved on to another animation.
+    times = []
+    current = sequence.current_animation
+    for _ in range(int(seconds / step)):
+        sequence.animate()
+        if sequence.current_animation is not current:
+            current = sequence.current_animation
+            times.append(clock.elapsed)
+        clock.advance(step)
+    return times
+
+
+@pytest.mark.parametrize("once", [False, True])
+def test_transition_runs_for_full_duration_on_cycle_complete(clock, once):
+    pixels = PixelBuffer(1)
+    first = ColorCycle(pixels, 0.5, colors=[(255, 0, 0), (0, 0, 255)])
+    second = ColorCycle(pixels, 0.5, colors=[(0, 255, 0), (255, 255, 255)])
+    if once:
+        sequence = AnimateOnce(first, second, transition=Crossfade(1.0))
+    else:
+        sequence = AnimationSequence(
+            first, second, advance_on_cycle_complete=True, transition=Crossfade(1.0)
+        )
+
+    times = _advances(sequence, clock, 6)
+
+    assert len(times) >= 2
+    for previous, later in zip(times, times[1:]):
+        assert later - previous >= 1.0
+
+
+def test_member_draws_when_activated_after_days_unused(clock):
+    pixels = PixelBuffer(1)
+    first = ColorCycle(pixels, 0.5)
+    second = ColorCycle(pixels, 0.5)
+    sequence = AnimationSequence(first, second, advance_interval=3600)
+    sequence.animate()
+    second.animate()
+    drawn = second.draw_count
+
+    # Longer than ticks_diff() can measure, so the old deadlines have wrapped around.
+    clock.advance(4 * 24 * 3600)
+    sequence.animate()
+
+    assert sequence.current_animation is second
+    assert second.draw_count == drawn + 1
+
+
+def test_transition_between_members_sharing_a_pixel_map(clock):
+    pixels = PixelBuffer(4)
+    shared = PixelMap(pixels, [0, 1, 2, 3], individual_pixels=True)
+    first = ColorCycle(shared, 0.1, colors=[(255, 0, 0)])
+    second = ColorCycle(shared, 0.1, colors=[(0, 0, 255)])
+    sequence = AnimationSequence(first, second, advance_interval=5, transition=Crossfade(1.0))
+
+    _advances(sequence, clock, 5.5)
+    mixed = pixels[0]
+    _advances(sequence, clock, 1.0)
+
+    assert 0 < mixed[0] < 255 and 0 < mixed[2] < 255
+    assert pixels[0] == (0, 0, 255)
+
+
+def test_next_during_transition(clock):
+    pixels = PixelBuffer(1)
+    first = ColorCycle(pixels, 0.1, colors=[(255, 0, 0)])
+    second = ColorCycle(pixels, 0.1, colors=[(0, 255, 0)])
+    third = ColorCycle(pixels, 0.1, colors=[(0, 0, 255)])
+    sequence = AnimationSequence(first, second, third, transition=Crossfade(1.0))
+    sequence.animate()
+    sequence._advance()
+    clock.advance(0.5)
+    sequence.animate()
+
+    sequence.next()
+    clock.advance(0.2)
+    sequence.animate()
+
+    assert sequence.current_animation is third
+    assert second.pixel_object is pixels
+    assert pixels[0] == (0, 0, 255)
@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_led_animation.animation.colorcycle import ColorCycle
+from adafruit_led_animation.group import AnimationGroup
+from adafruit_led_animation.pixelbuffer import PixelBuffer
+from adafruit_led_animation.scheduler import AnimationScheduler
+from adafruit_led_animation.stats import collect_stats, enable_stats
+
+
+@pytest.mark.parametrize("runner", [AnimationGroup, AnimationScheduler])
+def test_show_is_recorded_for_members(clock, runner):
+    first = ColorCycle(PixelBuffer(10), 0.1)
+    second = ColorCycle(PixelBuffer(10), 0.1)
+    item = runner(first, second)
+    enable_stats(item)
+
+    for _ in range(20):
+        item.animate()
+        clock.advance(0.1)
+
+    for stats in collect_stats(item).values():
+        assert stats["draw"]["count"] == 20
+        assert stats["show"]["count"] == 20
+
+
+def test_jitter_uses_the_animation_clock(clock):
+    animation = ColorCycle(PixelBuffer(10), 0.1)
+    enable_stats(animation)
+
+    for _ in range(20):
+        animation.animate()
+        clock.advance(0.1)
+
+    stats = collect_stats(animation)[animation]
+    assert stats["jitter"]["count"] == 19
+    assert stats["jitter"]["max"] == 0
@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from adafruit_led_animation.helper import FrameCommit, PixelMap
+from adafruit_led_animation.pixelbuffer import PixelBuffer
+from adafruit_led_animation.tiledgrid import Panel, TiledGrid
+
+
+def test_frame_merges_grid_with_views_of_its_strip():
+    strip = PixelBuffer(8)
+    grid = TiledGrid(Panel(strip, 2, 2), Panel(strip, 2, 2, x=2, start=4))
+    strip_map = PixelMap(strip, [0, 1], individual_pixels=True)
+    frame = FrameCommit()
+
+    grid[0, 0] = 0xFF0000
+    strip_map[1] = 0x00FF00
+    frame.add(grid)
+    frame.add(strip_map)
+
+    assert len(frame.strips) == 1
+    assert frame.strips[0] is strip